@@ -2,16 +2,34 @@
 
 import sys
 import os
-import json
 import logging
 import re
 import glob
 from typing import Any
+import orjson
 
 from impresso_essentials.utils import bytes_to, IssueDir
 
 logger = logging.getLogger(__name__)
 
+# naming conventions of the canonical files' basenames, per type of object
+FILENAME_PATTERNS = {
+    "issue": re.compile(r"^[A-Z]+-\d{4}-issues$"),
+    "page": re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]-pages$"),
+    "rebuilt": re.compile(r"^[A-Z]+-\d{4}$"),
+}
+# naming conventions of the canonical IDs, per type of object
+ID_PATTERNS = {
+    "issue": re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]$"),
+    "page": re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]-p\d{4}$"),
+    "content-item": re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]-i\d{4}$"),
+}
+CANONICAL_FILENAME_REGEX = re.compile(
+    r"^(?P<np>[A-Za-z0-9]+)-(?P<year>\d{4})"
+    r"-(?P<month>\d{2})-(?P<day>\d{2})"
+    r"-(?P<ed>[a-z])-(?P<type>[p|i])(?P<pgnb>\d{4})(?P<ext>.*)?$"
+)
+
 
 def parse_json(filename: str) -> dict[str, Any]:
     """Load the contents of a JSON file.
@@ -23,8 +41,8 @@ def parse_json(filename: str) -> dict[str, Any]:
         dict[str, Any]: Resulting json, contained inside the file
     """
     if os.path.isfile(filename):
-        with open(filename, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(filename, "rb") as f:
+            return orjson.loads(f.read())
     else:
         logger.info("File %s does not exist.", filename)
 
@@ -123,13 +141,7 @@ def check_filenaming(
     # if the file extension is still included, remove it.
     if "." in file_basename:
         file_basename = file_basename.split(".")[0]
-    match object_type:
-        case "issue":
-            pattern = re.compile(r"^[A-Z]+-\d{4}-issues$")
-        case "page":
-            pattern = re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]-pages$")
-        case "rebuilt":
-            pattern = re.compile(r"^[A-Z]+-\d{4}$")
+    pattern = FILENAME_PATTERNS[object_type]
 
     return pattern.match(file_basename)
 
@@ -145,13 +157,7 @@ def check_id(canonical_id: str, object_type: str = "issue") -> re.Match[str] | N
     Returns:
         Match[str] | None: The resulting match if correct, None otherwise
     """
-    match object_type:
-        case "issue":
-            pattern = re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]$")
-        case "page":
-            pattern = re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]-p\d{4}$")
-        case "content-item":
-            pattern = re.compile(r"^[A-Z]+-\d{4}-\d{2}-\d{2}-[a-z]-i\d{4}$")
+    pattern = ID_PATTERNS[object_type]
     return pattern.match(canonical_id)
 
 
@@ -181,14 +187,7 @@ def parse_canonical_filename(filename: str) -> tuple[str, tuple, str, str, int,
     Returns:
         tuple[str, tuple, str, str, int, str]: Parsed ID or filename.
     """
-    regex = re.compile(
-        (
-            r"^(?P<np>[A-Za-z0-9]+)-(?P<year>\d{4})"
-            r"-(?P<month>\d{2})-(?P<day>\d{2})"
-            r"-(?P<ed>[a-z])-(?P<type>[p|i])(?P<pgnb>\d{4})(?P<ext>.*)?$"
-        )
-    )
-    result = re.match(regex, filename)
+    result = CANONICAL_FILENAME_REGEX.match(filename)
     newspaper_id = result.group("np")
     date = (result.group("year"), result.group("month"), result.group("day"))
     page_number = int(result.group("pgnb"))
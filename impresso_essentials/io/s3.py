@@ -2,39 +2,78 @@
 """
 
 import bz2
-import json
 import logging
 import os
-from typing import Callable, Generator
-from collections import namedtuple
-
+import queue
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from time import monotonic
+from typing import Any, BinaryIO, Callable, Generator, Iterable
+
+import orjson
 import boto3
 from boto3.resources.base import ServiceResource
+from boto3.s3.transfer import TransferConfig
 import botocore
 from botocore.client import BaseClient
+from botocore.config import Config
 from dotenv import load_dotenv
 from smart_open import open as s_open
 import dask.bag as db
 
-from impresso_essentials.utils import bytes_to, id_to_issuedir
+from impresso_essentials.utils import bytes_to, id_to_issuedir, IssueDir
 
 logger = logging.getLogger(__name__)
 
 
+def _load_credentials() -> tuple[str | None, str | None, str | None]:
+    """Load the S3 credentials and host from the environment and local .env files.
+
+    Returns:
+        tuple[str | None, str | None, str | None]: Values of `SE_ACCESS_KEY`,
+            `SE_SECRET_KEY` and `SE_HOST_URL`, None for the ones not found.
+    """
+    load_dotenv()
+    return (
+        os.environ.get("SE_ACCESS_KEY"),
+        os.environ.get("SE_SECRET_KEY"),
+        os.environ.get("SE_HOST_URL"),
+    )
+
+
+# credentials are resolved once, use `refresh_credentials()` to reload them
+_SE_ACCESS_KEY, _SE_SECRET_KEY, _SE_HOST_URL = _load_credentials()
+# allow enough pooled connections for multi-threaded use, keep them alive and
+# retry throttled requests with backoff. Path-style addressing is kept as it's
+# what our (ceph) endpoint expects. Shared by the boto3 clients and by s3fs.
+_S3_CONFIG_KWARGS = {
+    "max_pool_connections": 50,
+    "tcp_keepalive": True,
+    "connect_timeout": 5,
+    "read_timeout": 60,
+    "retries": {"max_attempts": 10, "mode": "adaptive"},
+}
+
+
 def get_storage_options() -> dict[str, dict | str]:
     """Load environment variables from local .env files
 
     Assumes that two environment variables are set:
     `SE_ACCESS_KEY` and `SE_SECRET_KEY`.
 
+    Note:
+        The variables are read once when the module is loaded, call
+        `refresh_credentials()` to take changes of the environment into account.
+        The returned `config_kwargs` make the s3fs clients (used by dask) share
+        the connection pool size, timeouts and retry policy of the boto3 clients.
+
     Returns:
         dict[str, dict | str]: Credentials to access a S3 endpoint.
     """
-    load_dotenv()
-    try:
-        access_key = os.environ["SE_ACCESS_KEY"]
-        secret_key = os.environ["SE_SECRET_KEY"]
-    except Exception:
+    if _SE_ACCESS_KEY is None or _SE_SECRET_KEY is None:
         msg = (
             "Variables SE_ACCESS_KEY and SE_ACCESS_KEY were not found in the environment! "
             "Setting default values '' instead. Note the connection to S3 won't be possible currently."
@@ -43,17 +82,96 @@ def get_storage_options() -> dict[str, dict | str]:
         print(msg)
         access_key = ""
         secret_key = ""
+    else:
+        access_key = _SE_ACCESS_KEY
+        secret_key = _SE_SECRET_KEY
 
     return {
         "client_kwargs": {"endpoint_url": "https://os.zhdk.cloud.switch.ch"},
         "key": access_key,
         "secret": secret_key,
+        "config_kwargs": _S3_CONFIG_KWARGS,
     }
 
 
 IMPRESSO_STORAGEOPT = get_storage_options()
 
-IssueDir = namedtuple("IssueDirectory", ["journal", "date", "edition", "path"])
+# boto3 session, clients and resources are costly to create: they are created once
+# and reused. Clients are thread-safe and shared process-wide, but resources are not,
+# so those are cached per thread.
+_SESSION: boto3.Session | None = None
+_S3_CONFIG = Config(**_S3_CONFIG_KWARGS)
+# larger parts and more concurrent threads than the defaults for our large outputs
+_UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=20,
+    use_threads=True,
+)
+_CLIENT_CACHE: dict[str, BaseClient] = {}
+_RESOURCE_CACHE = threading.local()
+_CACHE_LOCK = threading.Lock()
+# incremented when the credentials are refreshed, to invalidate cached resources
+_CREDENTIALS_VERSION = 0
+
+
+def refresh_credentials() -> None:
+    """Reload the S3 credentials from the environment and local .env files.
+
+    The cached boto3 session, clients, resources and directory listings are
+    discarded, so that the following calls use the new credentials.
+    `IMPRESSO_STORAGEOPT` is updated inplace.
+    """
+    global _SE_ACCESS_KEY, _SE_SECRET_KEY, _SE_HOST_URL, _SESSION, _CREDENTIALS_VERSION
+    with _CACHE_LOCK:
+        _SE_ACCESS_KEY, _SE_SECRET_KEY, _SE_HOST_URL = _load_credentials()
+        _SESSION = None
+        _CLIENT_CACHE.clear()
+        _CREDENTIALS_VERSION += 1
+    IMPRESSO_STORAGEOPT.update(get_storage_options())
+    # the listings could differ with other credentials
+    list_s3_directories.cache_clear()
+
+
+def _get_session() -> boto3.Session:
+    """Get the boto3 session shared by all cached S3 clients and resources.
+
+    Must be called while holding `_CACHE_LOCK`, as boto3 sessions aren't thread-safe.
+
+    Raises:
+        KeyError: `SE_ACCESS_KEY` or `SE_SECRET_KEY` was not in the environment variables.
+
+    Returns:
+        boto3.Session: Session initialized with the S3 credentials.
+    """
+    global _SESSION
+    if _SESSION is None:
+        if _SE_ACCESS_KEY is None or _SE_SECRET_KEY is None:
+            raise KeyError("SE_ACCESS_KEY and SE_SECRET_KEY must be in the environment.")
+        _SESSION = boto3.Session(
+            aws_access_key_id=_SE_ACCESS_KEY,
+            aws_secret_access_key=_SE_SECRET_KEY,
+        )
+    return _SESSION
+
+
+def _resolve_host_url(host_url: str | None) -> str:
+    """Return the given host URL, or the one from `SE_HOST_URL` if None.
+
+    Args:
+        host_url (str | None): Host URL provided by the caller.
+
+    Raises:
+        KeyError: Argument `host_url` was not provided and `SE_HOST_URL` was not in the env.
+
+    Returns:
+        str: Host URL to use.
+    """
+    if host_url is not None:
+        return host_url
+    if _SE_HOST_URL is None:
+        raise KeyError("SE_HOST_URL")
+    return _SE_HOST_URL
 
 
 def get_s3_client(
@@ -64,37 +182,32 @@ def get_s3_client(
     Assumes that two environment variables are set:
     `SE_ACCESS_KEY` and `SE_SECRET_KEY`.
 
+    Note:
+        One client is created per endpoint and reused by subsequent calls.
+        boto3 clients are thread-safe, so it can be shared across threads.
+
     Args:
         host_url (str | None, optional): _description_. Defaults to
             "https://os.zhdk.cloud.switch.ch/".
 
     Raises:
-        e: Argument `host_url` was not provided and `SE_HOST_URL` was not in the env.
-        e: `SE_ACCESS_KEY` or `SE_SECRET_KEY` was not in the environment variables.
+        KeyError: Argument `host_url` was not provided and `SE_HOST_URL` was not in the env.
+        KeyError: `SE_ACCESS_KEY` or `SE_SECRET_KEY` was not in the environment variables.
 
     Returns:
         BaseClient: The S3 boto3 client.
     """
-    # load environment variables from local .env files
-    load_dotenv()
-    if host_url is None:
-        try:
-            host_url = os.environ["SE_HOST_URL"]
-        except Exception as e:
-            raise e
+    host_url = _resolve_host_url(host_url)
+    client = _CLIENT_CACHE.get(host_url)
+    if client is None:
+        with _CACHE_LOCK:
+            if host_url not in _CLIENT_CACHE:
+                _CLIENT_CACHE[host_url] = _get_session().client(
+                    "s3", endpoint_url=host_url, config=_S3_CONFIG
+                )
+            client = _CLIENT_CACHE[host_url]
 
-    try:
-        access_key = os.environ["SE_ACCESS_KEY"]
-        secret_key = os.environ["SE_SECRET_KEY"]
-    except Exception as e:
-        raise e
-
-    return boto3.client(
-        "s3",
-        aws_secret_access_key=secret_key,
-        aws_access_key_id=access_key,
-        endpoint_url=host_url,
-    )
+    return client
 
 
 def get_s3_resource(
@@ -105,37 +218,36 @@ def get_s3_resource(
     Assumes that two environment variables are set:
     `SE_ACCESS_KEY` and `SE_SECRET_KEY`.
 
+    Note:
+        boto3 resources aren't thread-safe: one resource is created per endpoint
+        and per thread, and reused by subsequent calls within that thread.
+
     Args:
         host_url (str | None, optional): _description_. Defaults to
             "https://os.zhdk.cloud.switch.ch/".
 
     Raises:
-        e: Argument `host_url` was not provided and `SE_HOST_URL` was not in the env.
-        e: `SE_ACCESS_KEY` or `SE_SECRET_KEY` was not in the environment variables.
+        KeyError: Argument `host_url` was not provided and `SE_HOST_URL` was not in the env.
+        KeyError: `SE_ACCESS_KEY` or `SE_SECRET_KEY` was not in the environment variables.
 
     Returns:
         ServiceResource: S3 resource associated to the endpoint.
     """
-    # load environment variables from local .env files
-    load_dotenv()
-    if host_url is None:
-        try:
-            host_url = os.environ["SE_HOST_URL"]
-        except Exception as e:
-            raise e
+    host_url = _resolve_host_url(host_url)
+    if getattr(_RESOURCE_CACHE, "version", None) != _CREDENTIALS_VERSION:
+        # first call in this thread, or credentials were refreshed since
+        _RESOURCE_CACHE.resources = {}
+        _RESOURCE_CACHE.version = _CREDENTIALS_VERSION
 
-    try:
-        access_key = os.environ["SE_ACCESS_KEY"]
-        secret_key = os.environ["SE_SECRET_KEY"]
-    except Exception as e:
-        raise e
+    resource = _RESOURCE_CACHE.resources.get(host_url)
+    if resource is None:
+        with _CACHE_LOCK:
+            resource = _get_session().resource(
+                "s3", endpoint_url=host_url, config=_S3_CONFIG
+            )
+        _RESOURCE_CACHE.resources[host_url] = resource
 
-    return boto3.resource(
-        "s3",
-        aws_secret_access_key=secret_key,
-        aws_access_key_id=access_key,
-        endpoint_url=host_url,
-    )
+    return resource
 
 
 def get_or_create_bucket(name: str, create: bool = False):
@@ -155,31 +267,292 @@ def get_or_create_bucket(name: str, create: bool = False):
         boto3.resources.factory.s3.Bucket: S3 bucket, fetched or created.
     """
     s3r = get_s3_resource()
-    # try to fetch the specified bucket -- may return an empty list
-    bucket = [b for b in s3r.buckets.all() if b.name == name]
-
+    # a single HEAD request on the bucket, instead of listing all buckets
     try:
-        assert len(bucket) > 0
-        return bucket[0]
+        s3r.meta.client.head_bucket(Bucket=name)
+        return s3r.Bucket(name)
+    except botocore.exceptions.ClientError as e:
+        if e.response["Error"]["Code"] not in ("404", "NoSuchBucket"):
+            raise e
 
     # bucket not found
-    except AssertionError:
-        if create:
-            bucket = s3r.create_bucket(Bucket=name)
-            print(f"New bucket {name} was created")
-        else:
-            print(f"Bucket {name} not found")
-            return None
+    if create:
+        bucket = s3r.create_bucket(Bucket=name)
+        print(f"New bucket {name} was created")
+    else:
+        print(f"Bucket {name} not found")
+        return None
 
     return bucket
 
 
+# maximum number of concurrent listings when listing a bucket's "directories"
+LISTING_MAX_WORKERS = 32
+# number of keys requested per listing call (the maximum allowed by S3)
+LISTING_PAGE_SIZE = 1000
+# size of the compressed chunks read from S3 when streaming files
+READ_CHUNK_SIZE = 64 * 1024
+# read buffer of the files opened with smart_open (its default is 128KB)
+READ_BUFFER_SIZE = 1024 * 1024
+# number of chunks which can be downloaded ahead of their decompression
+PREFETCH_CHUNKS = 16
+# objects larger than this are downloaded as several concurrent byte ranges
+RANGED_READ_THRESHOLD = 64 * 1024 * 1024
+# size of the byte ranges, and maximum number of them downloaded at once
+RANGED_READ_PART_SIZE = 16 * 1024 * 1024
+RANGED_READ_MAX_WORKERS = 4
+
+
+def _prefetch_chunks(
+    body: Any, chunk_size: int = READ_CHUNK_SIZE, max_chunks: int = PREFETCH_CHUNKS
+) -> Generator[bytes, None, None]:
+    """Read a stream by chunks in a background thread, ahead of their consumption.
+
+    This allows the download of the next chunks to overlap with the processing
+    (e.g. decompression and parsing) of the current one. At most `max_chunks`
+    chunks are kept in memory, waiting to be consumed.
+
+    Args:
+        body (Any): Stream to read from, e.g. a `botocore.response.StreamingBody`.
+        chunk_size (int, optional): Size of the chunks to read in bytes.
+            Defaults to READ_CHUNK_SIZE.
+        max_chunks (int, optional): Maximum number of chunks read in advance.
+            Defaults to PREFETCH_CHUNKS.
+
+    Note:
+        The stream is closed once consumed, or when the generator is closed early.
+
+    Yields:
+        Generator[bytes, None, None]: Consecutive chunks of the stream.
+    """
+    chunks = queue.Queue(maxsize=max_chunks)
+    stop = threading.Event()
+
+    def _put(item: bytes | Exception | None) -> bool:
+        # don't block forever if the consumer stopped before the end of the stream
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for chunk in iter(lambda: body.read(chunk_size), b""):
+                if not _put(chunk):
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            # forward the error to be raised by the consumer, releasing the connection
+            body.close()
+            _put(e)
+            return
+        # signal the end of the stream
+        _put(None)
+
+    threading.Thread(target=_produce, daemon=True).start()
+    try:
+        while (item := chunks.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # release the connection, also interrupting the producer if it's still reading
+        body.close()
+
+
+def _iter_bz2_lines(
+    chunks: Iterable[bytes], truncated: bool = False
+) -> Generator[str, None, None]:
+    """Decompress a stream of bz2-compressed chunks and yield its non-empty lines.
+
+    Only one chunk and the current incomplete line are kept in memory at once.
+    Files made of multiple concatenated bz2 streams are supported.
+
+    Args:
+        chunks (Iterable[bytes]): Consecutive chunks of a bz2-compressed text file.
+        truncated (bool, optional): Whether the chunks can stop before the end of the
+            file (e.g. for a byte range). If so, the last line is only yielded if the
+            bz2 stream was complete, as it could be cut otherwise. Defaults to False.
+
+    Yields:
+        Generator[str, None, None]: Decoded lines of the file, without line breaks.
+    """
+    decompressor = bz2.BZ2Decompressor()
+    leftover = b""
+    for chunk in chunks:
+        if decompressor.eof:
+            # the previous stream ended exactly at the chunk boundary
+            decompressor = bz2.BZ2Decompressor()
+        data = decompressor.decompress(chunk)
+        while decompressor.eof and decompressor.unused_data:
+            # multi-stream file: the rest of the chunk belongs to the next stream
+            unused_data = decompressor.unused_data
+            decompressor = bz2.BZ2Decompressor()
+            data += decompressor.decompress(unused_data)
+
+        lines = (leftover + data).split(b"\n")
+        # the last element is an incomplete line (or empty), wait for the next chunk
+        leftover = lines.pop()
+        for line in lines:
+            if line:
+                yield line.decode("utf-8")
+
+    if leftover and (not truncated or decompressor.eof):
+        yield leftover.decode("utf-8")
+
+
+class S3KeyNotFoundError(ValueError):
+    """The requested key does not exist in the given S3 bucket."""
+
+
+def _get_object(key_name: str, bucket_name: str, **get_kwargs) -> dict[str, Any]:
+    """Send a GET request for an S3 object and return the response.
+
+    Args:
+        key_name (str): S3 key, without S3 prefix, but with partitions within.
+        bucket_name (str): Name of S3 bucket to use.
+        **get_kwargs: Additional arguments to the GET request (e.g. `Range`).
+
+    Raises:
+        S3KeyNotFoundError: The provided key_name does not exist in the provided
+            bucket (subclass of ValueError).
+
+    Returns:
+        dict[str, Any]: Response to the request, with the object's streaming body.
+    """
+    s3r = get_s3_resource()
+    try:
+        return s3r.Object(bucket_name, key_name).get(**get_kwargs)
+    except s3r.meta.client.exceptions.NoSuchKey as e:
+        msg = (
+            f"The provided key_name {bucket_name}/{key_name} isn't in this bucket: {e}"
+        )
+        raise S3KeyNotFoundError(msg) from e
+
+
+def _get_object_body(key_name: str, bucket_name: str, **get_kwargs) -> Any:
+    """Send a GET request for an S3 object and return its streaming body.
+
+    Args:
+        key_name (str): S3 key, without S3 prefix, but with partitions within.
+        bucket_name (str): Name of S3 bucket to use.
+        **get_kwargs: Additional arguments to the GET request (e.g. `Range`).
+
+    Raises:
+        ValueError: The provided key_name does not exist in the provided bucket.
+
+    Returns:
+        botocore.response.StreamingBody: Body of the response, to read from.
+    """
+    return _get_object(key_name, bucket_name, **get_kwargs)["Body"]
+
+
+def _iter_ranged_chunks(
+    body: Any,
+    key_name: str,
+    bucket_name: str,
+    object_size: int,
+    etag: str,
+    part_size: int = RANGED_READ_PART_SIZE,
+    max_workers: int = RANGED_READ_MAX_WORKERS,
+) -> Generator[bytes, None, None]:
+    """Read a large S3 object with several concurrent GET requests of byte ranges.
+
+    The first part is streamed from the already opened `body`, while the following
+    parts are downloaded in parallel. Parts are yielded in order, and at most
+    `max_workers` of them are downloaded ahead of their consumption.
+    The ranged requests are conditioned on the ETag of the first response, so that
+    the parts can't come from different versions if the object is overwritten.
+
+    Args:
+        body (Any): Streaming body of a (non-ranged) GET request for the object.
+        key_name (str): S3 key, without S3 prefix, but with partitions within.
+        bucket_name (str): Name of S3 bucket to use.
+        object_size (int): Size of the object in bytes.
+        etag (str): ETag of the object, as returned with `body`.
+        part_size (int, optional): Size of the byte ranges to request.
+            Defaults to RANGED_READ_PART_SIZE.
+        max_workers (int, optional): Maximum number of concurrent requests.
+            Defaults to RANGED_READ_MAX_WORKERS.
+
+    Yields:
+        Generator[bytes, None, None]: Consecutive chunks of the object.
+    """
+    client = get_s3_client()
+
+    def _get_part(start: int) -> bytes:
+        end = min(start + part_size, object_size) - 1
+        response = client.get_object(
+            Bucket=bucket_name,
+            Key=key_name,
+            Range=f"bytes={start}-{end}",
+            IfMatch=etag,
+        )
+        return response["Body"].read()
+
+    part_starts = iter(range(part_size, object_size, part_size))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parts = deque(
+            executor.submit(_get_part, start)
+            for start in islice(part_starts, max_workers)
+        )
+
+        # the first part is read from the open body meanwhile
+        try:
+            remaining = part_size
+            while remaining > 0 and (
+                chunk := body.read(min(READ_CHUNK_SIZE, remaining))
+            ):
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            # release the connection, also if the consumer stopped early
+            body.close()
+
+        while parts:
+            part = parts.popleft().result()
+            parts.extend(executor.submit(_get_part, s) for s in islice(part_starts, 1))
+            yield part
+
+
+def _iter_object_chunks(
+    key_name: str, bucket_name: str
+) -> Generator[bytes, None, None]:
+    """Download an S3 object by chunks, ahead of their consumption.
+
+    Objects larger than `RANGED_READ_THRESHOLD` are downloaded by byte ranges with
+    concurrent requests, the others are streamed from a single request.
+
+    Args:
+        key_name (str): S3 key, without S3 prefix, but with partitions within.
+        bucket_name (str): Name of S3 bucket to use.
+
+    Raises:
+        ValueError: The provided key_name does not exist in the provided bucket.
+
+    Yields:
+        Generator[bytes, None, None]: Consecutive chunks of the object.
+    """
+    response = _get_object(key_name, bucket_name)
+    object_size = response["ContentLength"]
+
+    if object_size > RANGED_READ_THRESHOLD:
+        yield from _iter_ranged_chunks(
+            response["Body"], key_name, bucket_name, object_size, response["ETag"]
+        )
+    else:
+        yield from _prefetch_chunks(response["Body"])
+
+
 def read_jsonlines(key_name: str, bucket_name: str) -> Generator:
     """Given the S3 key of a jsonl.bz2 archive, extract and return its lines.
 
     Usage example:
     >>> lines = db.from_sequence(read_jsonlines(s3r, key_name , bucket_name))
-    >>> lines.map(json.loads).pluck('id').take(10)
+    >>> lines.map(orjson.loads).pluck('id').take(10)
 
     Args:
         key_name (str): S3 key, without S3 prefix, but with partitions within.
@@ -191,22 +564,56 @@ def read_jsonlines(key_name: str, bucket_name: str) -> Generator:
     Yields:
          Generator: generator yielding lines within the archive one by one.
     """
-    s3r = get_s3_resource()
-    try:
-        body = s3r.Object(bucket_name, key_name).get()["Body"]
+    # stream the file: decompress chunk by chunk rather than loading it all at once,
+    # while the next chunks are being downloaded
+    yield from _iter_bz2_lines(_iter_object_chunks(key_name, bucket_name))
 
-    except s3r.meta.client.exceptions.NoSuchKey as e:
-        msg = (
-            f"The provided key_name {bucket_name}/{key_name} isn't in this bucket: {e}"
-        )
-        raise ValueError(msg) from e
 
-    data = body.read()
-    text = bz2.decompress(data).decode("utf-8")
+def read_jsonlines_range(
+    key_name: str, bucket_name: str, byte_range: tuple[int, int]
+) -> Generator:
+    """Extract the lines of the first bytes of a jsonl.bz2 archive on S3.
+
+    Only the requested range of the compressed object is downloaded, which allows
+    to sample the first lines of large files without fetching them entirely.
+
+    Note:
+        A bz2 archive can only be decompressed from its start, hence the range
+        should start at 0. Lines are only obtained for the bz2 blocks (up to 900kB
+        of text each) which are entirely within the range, and the last, possibly
+        truncated, line is dropped unless the end of the file was reached.
+
+    Usage example:
+    >>> lines = read_jsonlines_range(key_name, bucket_name, (0, 1024 * 1024))
+    >>> next(lines)
+
+    Args:
+        key_name (str): S3 key, without S3 prefix, but with partitions within.
+        bucket_name (str): Name of S3 bucket to use.
+        byte_range (tuple[int, int]): Start and end (inclusive) of the compressed
+            bytes to read.
+
+    Raises:
+        ValueError: The range doesn't start at 0 or the provided key_name does not
+            exist in the provided bucket.
 
-    for line in text.split("\n"):
-        if line != "":
-            yield line
+    Yields:
+         Generator: generator yielding lines within the range one by one.
+    """
+    start, end = byte_range
+    if start != 0:
+        raise ValueError(
+            f"bz2 archives can only be read from their start, got range {byte_range}."
+        )
+
+    body = _get_object_body(key_name, bucket_name, Range=f"bytes={start}-{end}")
+    try:
+        yield from _iter_bz2_lines(
+            iter(lambda: body.read(READ_CHUNK_SIZE), b""), truncated=True
+        )
+    finally:
+        # release the connection, also when only the first lines were consumed
+        body.close()
 
 
 def readtext_jsonlines(
@@ -222,7 +629,7 @@ def readtext_jsonlines(
     This can serve as the starting point for pure textual processing.
     Usage example:
     >>> lines = db.from_sequence(readtext_jsonlines(s3r, key_name , bucket_name))
-    >>> lines.map(json.loads).pluck('ft').take(10)
+    >>> lines.map(orjson.loads).pluck('ft').take(10)
 
     Args:
         key_name (str): S3 key, without S3 prefix, but with partitions within.
@@ -237,27 +644,18 @@ def readtext_jsonlines(
     if fields_to_keep is None:
         # if no fields were provided
         fields_to_keep = ["id", "pp", "ts", "lg", "tp", "t", "ft"]
+    # constant-time membership checks when filtering each line's keys
+    fields_to_keep = frozenset(fields_to_keep)
 
-    s3r = get_s3_resource()
-    try:
-        body = s3r.Object(bucket_name, key_name).get()["Body"]
-    except s3r.meta.client.exceptions.NoSuchKey as e:
-        msg = (
-            f"The provided key_name {bucket_name}/{key_name} isn't in this bucket: {e}"
-        )
-        raise ValueError(msg) from e
-    data = body.read()
-    text = bz2.decompress(data).decode("utf-8")
-    for line in text.split("\n"):
-        if line != "":
-            article_json = json.loads(line)
-            if article_json["tp"] == "ar":
-                text = article_json["ft"]
-                if len(text) != 0:
-                    article_reduced = {
-                        k: article_json[k] for k in article_json if k in fields_to_keep
-                    }
-                    yield json.dumps(article_reduced)
+    for line in _iter_bz2_lines(_iter_object_chunks(key_name, bucket_name)):
+        article_json = orjson.loads(line)
+        if article_json["tp"] == "ar":
+            text = article_json["ft"]
+            if len(text) != 0:
+                article_reduced = {
+                    k: v for k, v in article_json.items() if k in fields_to_keep
+                }
+                yield orjson.dumps(article_reduced).decode("utf-8")
 
 
 def upload_to_s3(local_path: str, path_within_bucket: str, bucket_name: str) -> bool:
@@ -275,7 +673,7 @@ def upload_to_s3(local_path: str, path_within_bucket: str, bucket_name: str) ->
     try:
         # ensure the path within the bucket is only the key
         path_within_bucket = path_within_bucket.replace("s3://", "")
-        bucket.upload_file(local_path, path_within_bucket)
+        bucket.upload_file(local_path, path_within_bucket, Config=_UPLOAD_CONFIG)
         logger.info("Uploaded %s to s3://%s.", path_within_bucket, bucket_name)
         return True
     except Exception as e:
@@ -284,12 +682,79 @@ def upload_to_s3(local_path: str, path_within_bucket: str, bucket_name: str) ->
         return False
 
 
+def upload_fileobj_to_s3(
+    fileobj: BinaryIO, path_within_bucket: str, bucket_name: str
+) -> bool:
+    """Upload the contents of a binary file-like object to an S3 bucket.
+
+    The object is read and uploaded by parts, which allows to upload data as it is
+    being produced without writing it to a local file first.
+
+    Args:
+        fileobj (BinaryIO): File-like object opened in binary mode to upload.
+        path_within_bucket (str): The path within the bucket where the file will be uploaded.
+        bucket_name (str): The name of the S3 bucket (without any partitions).
+
+    Returns:
+        bool: True if the upload is successful, False otherwise.
+    """
+    bucket = get_bucket(bucket_name)
+    try:
+        # ensure the path within the bucket is only the key
+        path_within_bucket = path_within_bucket.replace("s3://", "")
+        bucket.upload_fileobj(fileobj, path_within_bucket, Config=_UPLOAD_CONFIG)
+        logger.info("Uploaded %s to s3://%s.", path_within_bucket, bucket_name)
+        return True
+    except Exception as e:
+        logger.error("The upload to %s failed with error %s", path_within_bucket, e)
+        return False
+
+
+def join_s3_path(*parts: str) -> str:
+    """Join parts of an S3 path or key with "/", regardless of the OS.
+
+    Contrary to `os.path.join`, the separator is always "/". Empty parts are skipped
+    and redundant slashes between parts are removed.
+
+    >>> join_s3_path("my-bucket/", "partition", "file.jsonl.bz2")
+    >>> 'my-bucket/partition/file.jsonl.bz2'
+
+    Args:
+        *parts (str): Parts of the path to join, the first can include "s3://".
+
+    Returns:
+        str: Joined S3 path or key.
+    """
+    parts = [p for p in parts if p]
+    if not parts:
+        return ""
+    return "/".join([parts[0].rstrip("/")] + [p.strip("/") for p in parts[1:]])
+
+
+def split_s3_path(s3_path: str) -> tuple[str, str]:
+    """Split an S3 path into its bucket name and the key (or prefix) within it.
+
+    >>> split_s3_path("s3://my-bucket/partition/file.jsonl.bz2")
+    >>> ('my-bucket', 'partition/file.jsonl.bz2')
+
+    Args:
+        s3_path (str): S3 path, with or without the "s3://" scheme.
+
+    Returns:
+        tuple[str, str]: Bucket name and key within the bucket ("" if there is none).
+    """
+    bucket_name, _, key = s3_path.removeprefix("s3://").partition("/")
+    return bucket_name, key
+
+
 def get_bucket(bucket_name: str):
     """Create a boto3 connection and return the desired bucket.
 
     Note:
         This function does not ensure that the bucket exists. If this verification
         is necessary, please prefer using `get_or_create_bucket()` instead.
+        Like the resources they are created from, buckets are cached per thread
+        and reused as long as the thread's S3 resource remains the same.
 
     Args:
         bucket_name (str): Name of the S3 bucket to use.
@@ -298,11 +763,169 @@ def get_bucket(bucket_name: str):
         boto3.resources.factory.s3.Bucket: Desired S3 bucket.
     """
     s3 = get_s3_resource()
-    return s3.Bucket(bucket_name)
+    if not hasattr(_RESOURCE_CACHE, "buckets"):
+        _RESOURCE_CACHE.buckets = {}
+
+    cached = _RESOURCE_CACHE.buckets.get(bucket_name)
+    # the resource changes if the credentials were refreshed since
+    if cached is None or cached[0] is not s3:
+        cached = (s3, s3.Bucket(bucket_name))
+        _RESOURCE_CACHE.buckets[bucket_name] = cached
+
+    return cached[1]
+
+
+def _iter_keys(
+    bucket_name: str, prefix: str = "", client: BaseClient | None = None
+) -> Generator[tuple[str, int], None, None]:
+    """Iterate over the keys of a bucket under a prefix, along with their size.
+
+    The raw `list_objects_v2` responses are used directly, avoiding the creation
+    of a boto3 `ObjectSummary` resource for each listed key.
+
+    Args:
+        bucket_name (str): Name of the S3 bucket to list.
+        prefix (str, optional): Prefix of the keys to list. Defaults to "".
+        client (BaseClient | None, optional): S3 client to use. Defaults to None,
+            in which case the client returned by `get_s3_client()` is used.
+
+    Yields:
+        Generator[tuple[str, int], None, None]: Each key and its size in bytes.
+    """
+    if client is None:
+        client = get_s3_client()
+    paginator = client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": LISTING_PAGE_SIZE},
+    )
+    for page in pages:
+        for obj in page.get("Contents", []):
+            yield obj["Key"], obj["Size"]
+
+
+def _iter_keys_concurrently(
+    bucket_name: str,
+    prefix: str = "",
+    client: BaseClient | None = None,
+    max_workers: int = LISTING_MAX_WORKERS,
+) -> Generator[tuple[str, int], None, None]:
+    """Iterate over the keys of a bucket under a prefix, listing "directories" in parallel.
+
+    A first delimited listing finds the "directories" directly under the prefix,
+    whose contents are then listed concurrently, one paginator per directory. The
+    keys are yielded as soon as the listings of the preceding directories are done,
+    and in the same (lexicographic) order as with `_iter_keys`. At most
+    `2 * max_workers` directories are listed ahead of their consumption.
+
+    Args:
+        bucket_name (str): Name of the S3 bucket to list.
+        prefix (str, optional): Prefix of the keys to list. Defaults to "".
+        client (BaseClient | None, optional): S3 client to use. Defaults to None,
+            in which case the client returned by `get_s3_client()` is used.
+        max_workers (int, optional): Maximum number of concurrent listings.
+            Defaults to LISTING_MAX_WORKERS.
+
+    Yields:
+        Generator[tuple[str, int], None, None]: Each key and its size in bytes.
+    """
+    if client is None:
+        client = get_s3_client()
+
+    top_level_keys, sub_prefixes = [], []
+    paginator = client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=prefix,
+        Delimiter="/",
+        PaginationConfig={"PageSize": LISTING_PAGE_SIZE},
+    )
+    for page in pages:
+        top_level_keys.extend((o["Key"], o["Size"]) for o in page.get("Contents", []))
+        sub_prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+
+    if not sub_prefixes:
+        yield from top_level_keys
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(sub_prefixes)))
+
+    def _list_sub_prefix(sub_prefix: str) -> list[tuple[str, int]]:
+        return list(_iter_keys(bucket_name, sub_prefix, client))
+
+    def _submit(sub_prefix: str) -> Future:
+        return executor.submit(_list_sub_prefix, sub_prefix)
+
+    prefixes_iter = iter(sub_prefixes)
+    top_level_iter = iter(top_level_keys)
+    next_top_level = next(top_level_iter, None)
+    try:
+        pending = deque(map(_submit, islice(prefixes_iter, 2 * max_workers)))
+        for sub_prefix in sub_prefixes:
+            # all keys of a directory start with its prefix, hence the top-level
+            # keys sorting before the prefix also sort before all of these keys
+            while next_top_level is not None and next_top_level[0] < sub_prefix:
+                yield next_top_level
+                next_top_level = next(top_level_iter, None)
+
+            sub_keys = pending.popleft().result()
+            pending.extend(map(_submit, islice(prefixes_iter, 1)))
+            yield from sub_keys
+    finally:
+        # don't keep listing if the consumer stopped early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if next_top_level is not None:
+        yield next_top_level
+        yield from top_level_iter
+
+
+def iter_fixed_s3fs_glob(
+    path: str, suffix: str | None = None, boto3_bucket=None, concurrent: bool = True
+) -> Generator[str, None, None]:
+    """Generator version of `fixed_s3fs_glob`, yielding the filenames one by one.
+
+    This avoids materializing the full list of filenames for large buckets, and
+    allows to start processing the files while they are being listed.
+
+    Args:
+        path (str): Glob path to the files, optionally including the bucket name.
+            If the bucket name is not included, `boto3_bucket` should be defined.
+        suffix (str | None, optional): Suffix or extension of the paths to consider
+            within the bucket. Only used if "*" not found in `path`. Defaults to None.
+        boto3_bucket (boto3.resources.factory.s3.Bucket, optional): S3 bucket to look
+            into. Defaults to None.
+        concurrent (bool, optional): Whether to list the "directories" under the
+            path concurrently. Should be False when called from multiple threads, to
+            not exceed the client's connection pool. Defaults to True.
+
+    Yields:
+        Generator[str, None, None]: Filenames within the bucket corresponding to the
+            provided path.
+    """
+    if boto3_bucket is None:
+        bucket_name, base_path = split_s3_path(path)
+        client = None
+    else:
+        bucket_name = boto3_bucket.name
+        base_path = path
+        client = boto3_bucket.meta.client
+
+    if "*" in base_path:
+        base_path, suffix_path = base_path.split("*")
+    else:
+        suffix_path = suffix or ""
+
+    list_keys = _iter_keys_concurrently if concurrent else _iter_keys
+    for key, _ in list_keys(bucket_name, base_path, client):
+        if key.endswith(suffix_path):
+            # prepend bucket-name as it is necessary for s3fs
+            yield f"s3://{bucket_name}/{key}"
 
 
 def fixed_s3fs_glob(
-    path: str, suffix: str | None = None, boto3_bucket=None
+    path: str, suffix: str | None = None, boto3_bucket=None, concurrent: bool = True
 ) -> list[str]:
     """Custom glob function able to list more than 1000 elements on s3 (fix of s3fs).
 
@@ -312,6 +935,8 @@ def fixed_s3fs_glob(
         If all files within the partitions should be considered, regardeless of their
         extension, "*" can be omitted.
         Conversely, `path` can be of the form "[partition]" if `suffix` is defined.
+        To iterate over the filenames without building the list, prefer using
+        `iter_fixed_s3fs_glob()`.
 
     Args:
         path (str): Glob path to the files, optionally including the bucket name.
@@ -320,41 +945,53 @@ def fixed_s3fs_glob(
             within the bucket. Only used if "*" not found in `path`. Defaults to None.
         boto3_bucket (boto3.resources.factory.s3.Bucket, optional): S3 bucket to look
             into. Defaults to None.
+        concurrent (bool, optional): Whether to list the "directories" under the
+            path concurrently. Should be False when called from multiple threads, to
+            not exceed the client's connection pool. Defaults to True.
 
     Returns:
         list[str]: List of filenames within the bucket corresponding to the provided path.
     """
+    return list(iter_fixed_s3fs_glob(path, suffix, boto3_bucket, concurrent))
+
+
+def iter_s3_glob_with_size(
+    path: str, boto3_bucket=None
+) -> Generator[tuple[str, float], None, None]:
+    """Generator version of `s3_glob_with_size`, yielding the files one by one.
+
+    Args:
+        path (str): The S3 path with a wildcard (*) to match files.
+                    Example: `s3://bucket_name/path/to/files/*.txt`.
+        boto3_bucket (boto3.Bucket, optional): An optional boto3 Bucket object.
+                                               If not provided, it will be
+                                               created from the path.
+
+    Yields:
+        Generator[tuple[str, float], None, None]: The full S3 path of each matching
+            file and its size in megabytes.
+    """
     if boto3_bucket is None:
-        if path.startswith("s3://"):
-            path = path[len("s3://") :]
-        bucket_name = path.split("/")[0]
-        base_path = "/".join(path.split("/")[1:])  # Remove bucket name
-        boto3_bucket = get_bucket(bucket_name)
+        bucket_name, base_path = split_s3_path(path)
+        client = None
     else:
         bucket_name = boto3_bucket.name
         base_path = path
+        client = boto3_bucket.meta.client
 
-    if "*" in base_path:
-        base_path, suffix_path = base_path.split("*")
-    else:
-        suffix_path = suffix
-
-    filenames = [
-        "s3://"
-        + os.path.join(
-            bucket_name, o.key
-        )  # prepend bucket-name as it is necessary for s3fs
-        for o in boto3_bucket.objects.filter(Prefix=base_path)
-        if o.key.endswith(suffix_path)
-    ]
+    base_path, suffix_path = base_path.split("*")
 
-    return filenames
+    for key, size in _iter_keys_concurrently(bucket_name, base_path, client):
+        if key.endswith(suffix_path):
+            yield f"s3://{bucket_name}/{key}", round(bytes_to(size, "m"), 6)
 
 
 def s3_glob_with_size(path: str, boto3_bucket=None):
     """
     Custom glob function to list S3 objects matching a pattern. This function
     works around the 1000-object listing limit in S3 by using boto3 directly.
+    To iterate over the files without building the list, prefer using
+    `iter_s3_glob_with_size()`.
 
     Args:
         path (str): The S3 path with a wildcard (*) to match files.
@@ -367,25 +1004,45 @@ def s3_glob_with_size(path: str, boto3_bucket=None):
         list: A list of tuples containing the full S3 paths of matching files
               and their sizes in megabytes.
     """
-    if boto3_bucket is None:
-        if path.startswith("s3://"):
-            path = path[len("s3://") :]
-        bucket_name = path.split("/")[0]
-        base_path = "/".join(path.split("/")[1:])  # Remove bucket name
-        boto3_bucket = get_bucket(bucket_name)
-    else:
-        bucket_name = boto3_bucket.name
-        base_path = path
+    return list(iter_s3_glob_with_size(path, boto3_bucket))
 
-    base_path, suffix_path = base_path.split("*")
 
-    filenames = [
-        ("s3://" + os.path.join(bucket_name, o.key), round(bytes_to(o.size, "m"), 6))
-        for o in boto3_bucket.objects.filter(Prefix=base_path)
-        if o.key.endswith(suffix_path)
-    ]
+@lru_cache(maxsize=8)
+def _get_credentials_client(key: str, secret: str, endpoint_url: str) -> BaseClient:
+    """Create an S3 client for the given credentials, reused across calls.
 
-    return filenames
+    boto3 clients are thread-safe, so keeping them avoids paying the session and
+    client setup (and new connections) for each file read.
+
+    Args:
+        key (str): S3 access key.
+        secret (str): S3 secret key.
+        endpoint_url (str): URL of the S3 endpoint to use.
+
+    Returns:
+        BaseClient: S3 client for these credentials and endpoint.
+    """
+    session = boto3.Session(aws_access_key_id=key, aws_secret_access_key=secret)
+    return session.client("s3", endpoint_url=endpoint_url, config=_S3_CONFIG)
+
+
+def _get_transport_params(s3_credentials: dict) -> dict[str, Any]:
+    """Get the smart_open transport parameters to read files with the given credentials.
+
+    Args:
+        s3_credentials (dict): S3 credentials, `IMPRESSO_STORAGEOPT`.
+
+    Returns:
+        dict[str, Any]: Transport parameters, with the (cached) client to use.
+    """
+    return {
+        "client": _get_credentials_client(
+            s3_credentials["key"],
+            s3_credentials["secret"],
+            s3_credentials["client_kwargs"]["endpoint_url"],
+        ),
+        "buffer_size": READ_BUFFER_SIZE,
+    }
 
 
 def alternative_read_text(
@@ -397,6 +1054,8 @@ def alternative_read_text(
         The reason for this function is a bug in `dask.bag.read_text()`
         which breaks on buckets having >= 1000 keys.
         It raises a `FileNotFoundError`.
+        To process the lines without loading the whole file in memory, prefer
+        using `iter_alternative_read_text()` or `iter_alternative_read_jsonlines()`.
 
     Args:
         s3_key (str): Full S3 path to the file to read.
@@ -408,14 +1067,7 @@ def alternative_read_text(
         list[str] | str: Contents of the file, as a list of strings or as one string.
     """
     logger.info("reading the text of %s", s3_key)
-    session = boto3.Session(
-        aws_access_key_id=s3_credentials["key"],
-        aws_secret_access_key=s3_credentials["secret"],
-    )
-    s3_endpoint = s3_credentials["client_kwargs"]["endpoint_url"]
-    transport_params = {
-        "client": session.client("s3", endpoint_url=s3_endpoint),
-    }
+    transport_params = _get_transport_params(s3_credentials)
 
     if line_by_line:
         with s_open(s3_key, "r", transport_params=transport_params) as infile:
@@ -427,6 +1079,55 @@ def alternative_read_text(
     return text
 
 
+def iter_alternative_read_text(
+    s3_key: str, s3_credentials: dict
+) -> Generator[str, None, None]:
+    """Generator version of `alternative_read_text`, yielding the lines one by one.
+
+    Only a buffer of the file is kept in memory at a time, instead of all its lines.
+
+    Args:
+        s3_key (str): Full S3 path to the file to read.
+        s3_credentials (dict): S3 credentials, `IMPRESSO_STORAGEOPT`.
+
+    Yields:
+        Generator[str, None, None]: Each line of the file.
+    """
+    logger.info("reading the text of %s", s3_key)
+    transport_params = _get_transport_params(s3_credentials)
+
+    with s_open(s3_key, "r", transport_params=transport_params) as infile:
+        yield from infile
+
+
+def iter_alternative_read_jsonlines(
+    s3_key: str, s3_credentials: dict
+) -> Generator[dict[str, Any], None, None]:
+    """Read from S3 a JSON-lines file (e.g. `*.jsonl.bz2`), yielding each parsed line.
+
+    The lines are read as bytes and parsed directly with orjson, without decoding
+    them first. Empty lines are skipped.
+
+    Args:
+        s3_key (str): Full S3 path to the file to read.
+        s3_credentials (dict): S3 credentials, `IMPRESSO_STORAGEOPT`.
+
+    Yields:
+        Generator[dict[str, Any], None, None]: Each JSON record of the file.
+    """
+    logger.info("reading the JSON lines of %s", s3_key)
+    transport_params = _get_transport_params(s3_credentials)
+
+    with s_open(s3_key, "rb", transport_params=transport_params) as infile:
+        for line in infile:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+# time (in seconds) during which the listed 'directories' are reused
+LIST_DIRS_TTL = 15 * 60
+
+
 def list_s3_directories(bucket_name: str, prefix: str = "") -> list[str]:
     """Retrieve 'directory' names (media titles) in an S3 bucket given a path prefix.
 
@@ -435,23 +1136,61 @@ def list_s3_directories(bucket_name: str, prefix: str = "") -> list[str]:
         prefix (str): The prefix path within the bucket to search. Default
                       is the root ('').
 
+    Note:
+        The results are cached per bucket and prefix for up to `LIST_DIRS_TTL`
+        seconds, see `_list_s3_directories`. Use `list_s3_directories.cache_clear()`
+        to list them again before that.
+
     Returns:
         list: A list of 'directory' names found in the specified bucket
               and prefix.
     """
-    logger.info("Listing 'folders'' of '%s' under prefix '%s'", bucket_name, prefix)
-    s3 = get_s3_client()
-    result = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix, Delimiter="/")
-
-    directories = []
-    if "CommonPrefixes" in result:
-        directories = [
-            prefix["Prefix"][:-1].split("/")[-1] for prefix in result["CommonPrefixes"]
-        ]
+    # changes every LIST_DIRS_TTL seconds, so that older cached listings aren't used
+    ttl_hash = int(monotonic() // LIST_DIRS_TTL)
+    directories = list(_list_s3_directories(bucket_name, prefix, ttl_hash))
     logger.info("Returning %s directories.", len(directories))
     return directories
 
 
+@lru_cache(maxsize=128)
+def _list_s3_directories(
+    bucket_name: str, prefix: str = "", ttl_hash: int | None = None
+) -> tuple[str, ...]:
+    """List the 'directory' names in an S3 bucket under a prefix, with caching.
+
+    All pages of the listing are considered, so that more than 1000 directories can
+    be returned. Results are cached per bucket, prefix and `ttl_hash`, as these
+    change rarely; `list_s3_directories` renews the `ttl_hash` periodically.
+
+    Args:
+        bucket_name (str): The name of the S3 bucket.
+        prefix (str): The prefix path within the bucket to search. Default
+                      is the root ('').
+        ttl_hash (int | None, optional): Value changing whenever the cached listings
+            should expire, only used as part of the cache key. Defaults to None.
+
+    Returns:
+        tuple[str, ...]: The 'directory' names found under the prefix.
+    """
+    logger.info("Listing 'folders'' of '%s' under prefix '%s'", bucket_name, prefix)
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=prefix,
+        Delimiter="/",
+        PaginationConfig={"PageSize": LISTING_PAGE_SIZE},
+    )
+
+    return tuple(
+        common_prefix["Prefix"][:-1].split("/")[-1]
+        for page in pages
+        for common_prefix in page.get("CommonPrefixes", [])
+    )
+
+
+list_s3_directories.cache_clear = _list_s3_directories.cache_clear
+
+
 def get_s3_object_size(bucket_name: str, key: str) -> int:
     """Get the size of an object (key) in an S3 bucket.
 
@@ -474,6 +1213,56 @@ def get_s3_object_size(bucket_name: str, key: str) -> int:
         return None
 
 
+def get_s3_object_sizes(
+    bucket_name: str, keys: Iterable[str]
+) -> dict[str, int | None]:
+    """Get the sizes of multiple objects (keys) in an S3 bucket at once.
+
+    Instead of one HEAD request per key as with `get_s3_object_size`, the keys are
+    grouped by "directory" and the objects under the longest common prefix of each
+    group are listed, which returns the sizes of up to 1000 objects per request.
+    The groups are listed concurrently.
+
+    Note:
+        This is efficient when the keys share prefixes (e.g. same media title)
+        under which few other objects are present.
+
+    Args:
+        bucket_name (str): The name of the S3 bucket.
+        keys (Iterable[str]): The keys (objects) whose sizes you want to retrieve.
+
+    Returns:
+        dict[str, int | None]: The size of each object in bytes, or None if the
+            object doesn't exist or its listing failed.
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+
+    keys_per_dir = defaultdict(list)
+    for key in keys:
+        keys_per_dir[key.rpartition("/")[0]].append(key)
+    prefixes = [os.path.commonprefix(dir_keys) for dir_keys in keys_per_dir.values()]
+
+    client = get_s3_client()
+
+    def _list_sizes(prefix: str) -> list[tuple[str, int]]:
+        try:
+            return list(_iter_keys(bucket_name, prefix, client))
+        except botocore.exceptions.ClientError as err:
+            # the sizes of this group's keys will be None, as with a failed HEAD
+            logger.error("Error: %s for prefix %s in %s", err, prefix, bucket_name)
+            return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(LISTING_MAX_WORKERS, len(prefixes))
+    ) as executor:
+        listings = executor.map(_list_sizes, prefixes)
+        listed_sizes = {key: size for listing in listings for key, size in listing}
+
+    return {key: listed_sizes.get(key) for key in keys}
+
+
 def s3_iter_bucket(
     bucket_name: str,
     prefix: str = "",
@@ -488,6 +1277,8 @@ def s3_iter_bucket(
     Note:
         If `suffix` is not "", the used accepting condition will become:
         `lambda key: accept_key(key) and key.endswith(suffix)`
+        The "directories" directly under `prefix` are listed in parallel, see
+        `_iter_keys_concurrently`.
 
     Args:
         bucket_name (str): Name of the S3 bucket to list the contents of
@@ -499,22 +1290,12 @@ def s3_iter_bucket(
     Returns:
         list: List of keys corresponding ot the provided prefix, suffix and accept key.
     """
-    if suffix != "":
-        filter_condition = lambda k: accept_key(k) and k.endswith(suffix)
-    else:
-        filter_condition = accept_key
-
-    client = get_s3_client()
-    paginator = client.get_paginator("list_objects")
-    page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
-    keys = []
-    for page in page_iterator:
-        if "Contents" in page:
-            for key in page["Contents"]:
-                key_string = key["Key"]
-                if filter_condition(key_string):
-                    keys.append(key_string)
-    return keys if keys else []
+    # the "directories" under the prefix are listed concurrently
+    return [
+        key
+        for key, _ in _iter_keys_concurrently(bucket_name, prefix)
+        if key.endswith(suffix) and accept_key(key)
+    ]
 
 
 def read_s3_issues(
@@ -522,25 +1303,40 @@ def read_s3_issues(
 ) -> list[tuple[IssueDir, dict]]:
     """Read the contents of canonical issues from a given S3 bucket.
 
+    Note:
+        The issues file is streamed with `read_jsonlines()`, hence through the
+        cached boto3 resource of `get_s3_resource()` for its default endpoint (the
+        same as in `IMPRESSO_STORAGEOPT`), instead of through dask and s3fs.
+        `SE_ACCESS_KEY` and `SE_SECRET_KEY` must thus be set in the environment,
+        otherwise a KeyError is raised. `SE_HOST_URL` is not needed.
+
     Args:
         newspaper (str): Name of the newspaper to read the issues from.
         year (str): Target year to tread issues from.
         input_bucket (str): Bucket from where to fetch the issues.
 
+    Raises:
+        KeyError: `SE_ACCESS_KEY` or `SE_SECRET_KEY` was not in the environment.
+        orjson.JSONDecodeError: The issues file contains invalid JSON.
+
     Returns:
         list[tuple[IssueDir, dict]]: List of IssueDirs and the issues' contents.
     """
-    issue_path_on_s3 = (
-        f"s3://{input_bucket}/{newspaper}/issues/{newspaper}-{year}-issues.jsonl.bz2"
-    )
+    # the input bucket can include a partition, which is part of the key
+    bucket_name, partition = split_s3_path(input_bucket)
+    issue_key = f"{newspaper}/issues/{newspaper}-{year}-issues.jsonl.bz2"
+    if partition:
+        issue_key = f"{partition.rstrip('/')}/{issue_key}"
+    issue_path_on_s3 = f"s3://{bucket_name}/{issue_key}"
+
+    # a single file is read: stream it directly rather than building a dask graph
     try:
-        issues = (
-            db.read_text(issue_path_on_s3, storage_options=IMPRESSO_STORAGEOPT)
-            .map(json.loads)
-            .map(lambda x: (id_to_issuedir(x["id"], issue_path_on_s3), x))
-            .compute()
-        )
-    except FileNotFoundError as e:
+        issues = [
+            (id_to_issuedir(issue["id"], issue_path_on_s3), issue)
+            for issue in map(orjson.loads, read_jsonlines(issue_key, bucket_name))
+        ]
+    except S3KeyNotFoundError as e:
+        # no issues for this title and year, other errors are raised
         logger.error(e)
         return []
 
@@ -549,51 +1345,91 @@ def read_s3_issues(
 
 def list_newspapers(
     bucket_name: str,
-    s3_client=get_s3_client(),
-    page_size: int = 10000,
+    s3_client: BaseClient | None = None,
+    page_size: int = LISTING_PAGE_SIZE,
 ) -> list[str]:
     """List newspapers contained in an s3 bucket with impresso data.
 
-    Note:
-        25,000 seems to be the maximum `PageSize` value supported by
-        SwitchEngines' S3 implementation (ceph).
+    Only the top-level "directories" of the bucket are listed (using a delimited
+    `list_objects_v2` listing), rather than all of the keys it contains.
+
     Note:
         Copied from https://github.com/impresso/impresso-data-sanitycheck/tree/master/sanity_check/contents/s3_data.py
 
     Args:
         bucket_name (str): Name of the S3 bucket to consider
-        s3_client (optional): S3 client to use. Defaults to get_s3_client().
-        page_size (int, optional): Pagination configuration. Defaults to 10000.
+        s3_client (BaseClient | None, optional): S3 client to use. Defaults to None,
+            in which case the client returned by `get_s3_client()` is used.
+        page_size (int, optional): Pagination configuration. Defaults to
+            LISTING_PAGE_SIZE.
 
     Returns:
-        list[str]: List of newspaper (aliases) present in the given S3 bucket.
+        list[str]: Sorted list of newspaper (aliases) present in the given S3 bucket.
     """
     print(f"Fetching list of newspapers from {bucket_name}")
+    if s3_client is None:
+        s3_client = get_s3_client()
 
-    if "s3://" in bucket_name:
-        bucket_name = bucket_name.replace("s3://", "").split("/")[0]
+    bucket_name, _ = split_s3_path(bucket_name)
 
-    paginator = s3_client.get_paginator("list_objects")
+    paginator = s3_client.get_paginator("list_objects_v2")
 
     newspapers = set()
     for n, resp in enumerate(
-        paginator.paginate(Bucket=bucket_name, PaginationConfig={"PageSize": page_size})
+        paginator.paginate(
+            Bucket=bucket_name,
+            Delimiter="/",
+            PaginationConfig={"PageSize": page_size},
+        )
     ):
         # means the bucket is empty
-        if "Contents" not in resp:
+        if resp.get("KeyCount") == 0:
             continue
 
-        for f in resp["Contents"]:
-            newspapers.add(f["Key"].split("/")[0])
-        msg = (
-            f"Paginated listing of keys in {bucket_name}: page {n + 1}, listed "
-            f"{len(resp['Contents'])}"
+        prefixes = resp.get("CommonPrefixes", [])
+        newspapers.update(p["Prefix"].rstrip("/") for p in prefixes)
+        logger.info(
+            "Paginated listing of newspapers in %s: page %s, listed %s",
+            bucket_name,
+            n + 1,
+            len(prefixes),
         )
-        logger.info(msg)
 
     print(f"{bucket_name} contains {len(newspapers)} newspapers")
 
-    return newspapers
+    return sorted(newspapers)
+
+
+def _list_newspaper_files(
+    bucket_name: str, newspapers: list[str], file_type: str
+) -> list[str]:
+    """List the files of a given type for each newspaper, one listing per newspaper.
+
+    The newspapers are listed concurrently, and the files are returned in the order
+    of the provided newspapers.
+
+    Args:
+        bucket_name (str): S3 bucket name.
+        newspapers (list[str]): Newspapers for which to list the files.
+        file_type (str): Type of files to list, "issues" or "pages".
+
+    Returns:
+        list[str]: Files of the given type for all newspapers.
+    """
+    if not newspapers:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(LISTING_MAX_WORKERS, len(newspapers))
+    ) as executor:
+        # each newspaper is listed sequentially to stay within the connection pool
+        files_per_np = executor.map(
+            lambda np: fixed_s3fs_glob(
+                f"{bucket_name}/{np}/{file_type}/*", concurrent=False
+            ),
+            newspapers,
+        )
+        return [file for np_files in files_per_np for file in np_files]
 
 
 def list_files(
@@ -628,34 +1464,50 @@ def list_files(
 
     if newspapers_filter is not None:
         suffix = f"for the provided newspapers {newspapers_filter}"
+        newspapers = [np for np in newspapers if np in newspapers_filter]
     else:
         suffix = ""
 
     if file_type in ["issues", "both"]:
-        issue_files = [
-            file
-            for np in newspapers
-            if newspapers_filter is not None and np in newspapers_filter
-            for file in fixed_s3fs_glob(os.path.join(bucket_name, f"{np}/issues/*"))
-        ]
+        issue_files = _list_newspaper_files(bucket_name, newspapers, "issues")
         print(f"{bucket_name} contains {len(issue_files)} .bz2 issue files {suffix}")
     if file_type in ["pages", "both"]:
-        page_files = [
-            file
-            for np in newspapers
-            if newspapers_filter is not None and np in newspapers_filter
-            for file in fixed_s3fs_glob(f"{os.path.join(bucket_name, f'{np}/pages/*')}")
-        ]
+        page_files = _list_newspaper_files(bucket_name, newspapers, "pages")
         print(f"{bucket_name} contains {len(page_files)} .bz2 page files {suffix}")
 
     return issue_files, page_files
 
 
+# bounds used to group the (many and small) fetched files into dask partitions
+MAX_FILES_PER_PARTITION = 32
+MIN_FETCH_PARTITIONS = 128
+
+
+def _get_files_per_partition(num_files: int, files_per_partition: int | None) -> int:
+    """Get the number of files to group within each partition when reading them.
+
+    Unless specified, files are grouped by up to `MAX_FILES_PER_PARTITION`, while
+    keeping at least `MIN_FETCH_PARTITIONS` partitions to spread across workers.
+
+    Args:
+        num_files (int): Number of files to read.
+        files_per_partition (int | None): Number of files per partition requested
+            by the caller, if any.
+
+    Returns:
+        int: Number of files to group within each partition.
+    """
+    if files_per_partition is not None:
+        return files_per_partition
+    return max(1, min(MAX_FILES_PER_PARTITION, num_files // MIN_FETCH_PARTITIONS))
+
+
 def fetch_files(
     bucket_name: str,
     compute: bool = True,
     file_type: str = "issues",
     newspapers_filter: list[str] | None = None,
+    files_per_partition: int | None = None,
 ) -> (
     tuple[db.core.Bag | None, db.core.Bag | None]
     | tuple[list[str] | None, list[str] | None]
@@ -679,6 +1531,9 @@ def fetch_files(
             "pages" and "both". Defaults to "issues".
         newspapers_filter: (list[str]|None,optional): List of newspapers to consider.
             If None, all will be considered. Defaults to None.
+        files_per_partition (int | None, optional): Number of files to read within
+            each partition of the bags. Defaults to None, in which case it's derived
+            from the number of files, see `_get_files_per_partition`.
 
     Raises:
         NotImplementedError: The given `file_type` is not one of ['issues', 'pages', 'both'].
@@ -699,9 +1554,13 @@ def fetch_files(
     msg = "Fetching "
     if issue_files is not None:
         msg = f"{msg} issue ids from {len(issue_files)} .bz2 files, "
-        issue_bag = db.read_text(issue_files, storage_options=IMPRESSO_STORAGEOPT).map(
-            json.loads
-        )
+        issue_bag = db.read_text(
+            issue_files,
+            storage_options=IMPRESSO_STORAGEOPT,
+            files_per_partition=_get_files_per_partition(
+                len(issue_files), files_per_partition
+            ),
+        ).map(orjson.loads)
     if page_files is not None:
         # make sure all files are .bz2 files and exactly have the naming format they should
         prev_len = len(page_files)
@@ -709,9 +1568,13 @@ def fetch_files(
             p for p in page_files if ".jsonl.bz2" in p and len(p.split("-")) > 5
         ]
         msg = f"{msg} page ids from {len(page_files)} .bz2 files ({prev_len} files before filtering), "
-        page_bag = db.read_text(page_files, storage_options=IMPRESSO_STORAGEOPT).map(
-            json.loads
-        )
+        page_bag = db.read_text(
+            page_files,
+            storage_options=IMPRESSO_STORAGEOPT,
+            files_per_partition=_get_files_per_partition(
+                len(page_files), files_per_partition
+            ),
+        ).map(orjson.loads)
 
     logger.info(msg)
 
@@ -9,14 +9,59 @@ Options:
     --prefix=<p>    Prefix of keys to delete
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, Iterator
 from docopt import docopt
 from botocore.client import BaseClient
-from impresso_essentials.io.s3 import get_s3_resource
-from impresso_essentials.utils import user_confirmation
+from impresso_essentials.io.s3 import get_s3_client
+from impresso_essentials.utils import init_logger, user_confirmation
 
 # from impresso_commons.utils.s3 import get_s3_resource
 # from impresso_commons.utils import user_confirmation
 
+logger = logging.getLogger(__name__)
+
+# number of deleted keys between two progress messages
+LOG_EVERY_N_KEYS = 10000
+
+
+def _list_object_pages(
+    client: BaseClient, bucket: str, prefix: str, max_keys: int = 1000
+) -> Generator[dict, None, None]:
+    """List the objects within a bucket based on a given prefix, page by page.
+
+    Args:
+        client (BaseClient): S3 client.
+        bucket (str): Name of the bucket to list the keys of.
+        prefix (str): Prefix to the partition from which to list keys.
+        max_keys (int, optional): Max number of keys per page. Defaults to 1000.
+
+    Yields:
+        Generator[dict, None, None]: `list_objects_v2` responses, one per page.
+    """
+    # the paginator passes the continuation token of each page to the next request
+    paginator = client.get_paginator("list_objects_v2")
+    yield from paginator.paginate(
+        Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": max_keys}
+    )
+
+
+def _prefetch_pages(pages: Iterator[dict]) -> Generator[dict, None, None]:
+    """Fetch the next page of a listing in the background while the current is used.
+
+    Args:
+        pages (Iterator[dict]): Iterator over the pages of a listing.
+
+    Yields:
+        Generator[dict, None, None]: The pages of the listing, in the same order.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_page = executor.submit(next, pages, None)
+        while (page := next_page.result()) is not None:
+            next_page = executor.submit(next, pages, None)
+            yield page
+
 
 def delete_versioned_keys(
     client: BaseClient,
@@ -26,40 +71,34 @@ def delete_versioned_keys(
 ):
     """Delete all the keys within a bucket based on a given prefix.
 
+    The next page of keys is listed while the current one is being deleted.
+
     Args:
         client (BaseClient): S3 client.
         bucket (str): Name of the bucket to delete keys from.
         prefix (str): Prefix to the partition from which to delete keys.
         max_keys (int, optional): Max number of keys to delete at once. Defaults to 1000.
     """
-    # initialize the first values of is_truncated and next_token.
-    next_token = None
-    is_truncated = True
-    while is_truncated:
-        # list the objects to delete from the bucket's partition
-        if not next_token:
-            objects_list = client.list_objects_v2(
-                Bucket=bucket, MaxKeys=max_keys, Prefix=prefix
-            )
-        else:
-            objects_list = client.list_objects_v2(
-                Bucket=bucket, MaxKeys=max_keys, Prefix=prefix, StartAfter=next_token
+    nb_deleted, next_log = 0, LOG_EVERY_N_KEYS
+    pages = _list_object_pages(client, bucket, prefix, max_keys)
+    for objects_list in _prefetch_pages(pages):
+        # delete identified objects, in quiet mode only the errors are returned
+        objects = [{"Key": c["Key"]} for c in objects_list.get("Contents", [])]
+        if objects:
+            response = client.delete_objects(
+                Bucket=bucket, Delete={"Objects": objects, "Quiet": True}
             )
+            errors = response.get("Errors", [])
+            nb_deleted += len(objects) - len(errors)
+            for error in errors:
+                logger.error("Could not delete %s: %s", error["Key"], error["Message"])
 
-        # delete identified objects
-        try:
-            objects = [{"Key": c["Key"]} for c in objects_list["Contents"]]
-            response = client.delete_objects(Bucket=bucket, Delete={"Objects": objects})
-            print(f"Deleted {len(response['Deleted'])} keys")
-        except Exception:
-            pass
+        # periodic progress feedback rather than one message per page
+        if nb_deleted >= next_log:
+            logger.info("Deleted %s keys so far", nb_deleted)
+            next_log = nb_deleted + LOG_EVERY_N_KEYS
 
-        # if more keys remain in the partition, continue process
-        is_truncated = objects_list["IsTruncated"]
-        try:
-            next_token = objects_list["NextContinuationToken"]
-        except KeyError:
-            print("Done!")
+    logger.info("Done! Deleted %s keys in total.", nb_deleted)
 
 
 def main():
@@ -70,8 +109,9 @@ def main():
     q = f"\nAre you sure you want to delete {q_1} from bucket `s3://{b}` ?"
 
     if user_confirmation(question=q):
+        init_logger(logger)
         print("Ok, let's start (it will take a while!)")
-        s3_client = get_s3_resource().meta.client
+        s3_client = get_s3_client()
         delete_versioned_keys(client=s3_client, bucket=b, prefix=p)
     else:
         print("Ok then, see ya!")
@@ -3,9 +3,17 @@
 
 import re
 import logging
+import threading
+from bisect import bisect_left
+from functools import lru_cache
 import pysbd
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+
+try:
+    # optional, much faster (but language-agnostic) sentence segmentation
+    from blingfire import text_to_sentences
+except ImportError:
+    text_to_sentences = None
 
 logger = logging.getLogger(__name__)
 
@@ -60,46 +68,195 @@ WHITESPACE_RULES = {
 }
 
 
+def _compile_token_regex(wsrules: dict[str, list[str]]) -> re.Pattern:
+    """Compile the regex splitting a text into tokens given a language's whitespace rules.
+
+    Each punctuation character is its own token, and tokens are otherwise separated by
+    whitespace. Only single-character punctuation marks are considered.
+
+    Args:
+        wsrules (dict[str, list[str]]): Whitespace rules of a language.
+
+    Returns:
+        re.Pattern: Regex matching the successive tokens of a text.
+    """
+    punctuation = {
+        pct
+        for key in ["pct_no_ws_before_after", "pct_no_ws_before", "pct_no_ws_after"]
+        for pct in wsrules[key]
+        if len(pct) == 1
+    }
+    pct_class = re.escape("".join(sorted(punctuation)))
+    return re.compile(f"[{pct_class}]|[^\\s{pct_class}]+")
+
+
+# compiled once, tokenising a text is then a single regex pass
+TOKEN_REGEXES = {
+    language: _compile_token_regex(wsrules)
+    for language, wsrules in WHITESPACE_RULES.items()
+}
+# languages without specific rules are tokenised with the "other" rules
+_DEFAULT_TOKEN_REGEX = TOKEN_REGEXES["other"]
+
+# pysbd segmenters compile their rules upon creation, so they are created once per
+# language and reused. They keep state while segmenting, so they are cached per thread.
+_SEGMENTERS = threading.local()
+
+
+def _get_segmenter(language: str) -> pysbd.Segmenter:
+    """Get the pysbd segmenter for the given language, creating it if necessary.
+
+    Languages not supported by pysbd fall back on the English segmenter.
+
+    Args:
+        language (str): Two-letter language code.
+
+    Returns:
+        pysbd.Segmenter: Segmenter to use for this language in the current thread.
+    """
+    if not hasattr(_SEGMENTERS, "by_language"):
+        _SEGMENTERS.by_language = {}
+
+    segmenter = _SEGMENTERS.by_language.get(language)
+    if segmenter is None:
+        try:
+            segmenter = pysbd.Segmenter(language=language, clean=False)
+        except ValueError:
+            segmenter = _get_segmenter("en")
+        _SEGMENTERS.by_language[language] = segmenter
+
+    return segmenter
+
+
+def _segment_with_blingfire(article: str) -> list[str]:
+    """Segment the given article into sentences with blingfire.
+
+    Args:
+        article (str): Full-text article to segment into sentences.
+
+    Returns:
+        list[str]: Sentences of the article.
+    """
+    # blingfire returns the sentences separated by newlines
+    return text_to_sentences(article).split("\n")
+
+
 def segment_and_trim_sentences(
-    article: str, language: str, max_length: int
+    article: str, language: str, max_length: int, use_blingfire: bool = False
 ) -> list[str]:
     """Segment the given article into trimmed sentences based on a max_length.
 
+    Note:
+        If `use_blingfire` is True but blingfire is not installed, the segmentation
+        is done with pysbd.
+
     Args:
         article (str): Full-text article to segment into sentences.
         language (str): Two-letter language code of article.
         max_length (int): Maximum length for each segmented sentence.
+        use_blingfire (bool, optional): Whether to segment the article with
+            blingfire, which is much faster but does not use language-specific rules.
+            Defaults to False.
 
     Returns:
         list[str]: List of resulting trimmed sentences.
     """
-    try:
-        segmenter = pysbd.Segmenter(language=language, clean=False)
-    except ValueError:
-        segmenter = pysbd.Segmenter(language="en", clean=False)
-
-    sentences = segmenter.segment(article)
+    if use_blingfire and text_to_sentences is not None:
+        sentences = _segment_with_blingfire(article)
+    else:
+        sentences = _get_segmenter(language).segment(article)
 
     trimmed_sentences = []
     for sentence in sentences:
-        while len(sentence) > max_length:
-            # Find the last space within max_length
-            cut_index = sentence.rfind(" ", 0, max_length)
-            if cut_index == -1:
-                # If no space found, forcibly cut at max_length
-                cut_index = max_length
+        _trim_sentence(sentence, max_length, trimmed_sentences)
 
-            # Cut the sentence and add the first part to trimmed sentences
-            trimmed_sentences.append(sentence[:cut_index])
+    return trimmed_sentences
 
-            # Update the sentence to be the remaining part
-            sentence = sentence[cut_index:].lstrip()
 
-        # Add the remaining part of the sentence if it's not empty
-        if sentence:
-            trimmed_sentences.append(sentence)
+def segment_and_trim_batch(
+    articles: list[str], language: str, max_length: int, use_blingfire: bool = False
+) -> list[list[str]]:
+    """Segment a batch of articles in the same language into trimmed sentences.
 
-    return trimmed_sentences
+    Equivalent to calling `segment_and_trim_sentences` on each article, but the
+    segmenter is fetched only once for the whole batch.
+
+    Args:
+        articles (list[str]): Full-text articles to segment into sentences.
+        language (str): Two-letter language code of the articles.
+        max_length (int): Maximum length for each segmented sentence.
+        use_blingfire (bool, optional): Whether to segment the articles with
+            blingfire if it's installed. Defaults to False.
+
+    Returns:
+        list[list[str]]: Trimmed sentences of each article, in the input order.
+    """
+    if use_blingfire and text_to_sentences is not None:
+        segment = _segment_with_blingfire
+    else:
+        segment = _get_segmenter(language).segment
+
+    batch_sentences = []
+    for article in articles:
+        trimmed_sentences = []
+        for sentence in segment(article):
+            _trim_sentence(sentence, max_length, trimmed_sentences)
+        batch_sentences.append(trimmed_sentences)
+
+    return batch_sentences
+
+
+def _trim_sentence(sentence: str, max_length: int, trimmed_sentences: list[str]) -> None:
+    """Cut a sentence into parts of at most max_length, preferably on spaces.
+
+    The sentence is never copied: only the start of its remaining part is moved forward.
+
+    Args:
+        sentence (str): Sentence to trim.
+        max_length (int): Maximum length for each part of the sentence.
+        trimmed_sentences (list[str]): List to which the parts are appended.
+    """
+    start = 0
+    length = len(sentence)
+    while length - start > max_length:
+        # Find the last space within max_length of the remaining part
+        cut_index = sentence.rfind(" ", start, start + max_length)
+        if cut_index == -1:
+            # If no space found, forcibly cut at max_length
+            cut_index = start + max_length
+
+        # Cut the sentence and add the first part to trimmed sentences
+        trimmed_sentences.append(sentence[start:cut_index])
+
+        # Skip the whitespace at the start of the remaining part
+        start = cut_index
+        while start < length and sentence[start].isspace():
+            start += 1
+
+    # Add the remaining part of the sentence if it's not empty
+    if start < length:
+        trimmed_sentences.append(sentence[start:])
+
+
+# words, or runs of punctuation marks, as separate tokens
+WORD_REGEX = re.compile(r"\w+|[^\w\s]+")
+
+
+@lru_cache(maxsize=32)
+def _get_stopwords(languages: tuple[str, ...]) -> frozenset[str]:
+    """Load the NLTK stopwords of the given languages, only once per combination.
+
+    Args:
+        languages (tuple[str, ...]): Languages for which to load the stopwords.
+
+    Returns:
+        frozenset[str]: Union of the stopwords of all the languages.
+    """
+    stopwords_list = set()
+    for lang in languages:
+        stopwords_list.update(stopwords.words(lang))
+
+    return frozenset(stopwords_list)
 
 
 def is_stopword_or_all_stopwords(text: str, languages: list | None = None) -> bool:
@@ -117,19 +274,13 @@ def is_stopword_or_all_stopwords(text: str, languages: list | None = None) -> bo
         languages = ["french", "german"]
 
     # Load stopwords for the specified languages
-    stopwords_list = set()
-    for lang in languages:
-        stopwords_list.update(stopwords.words(lang))
-
-    # Tokenize the text
-    tokens = word_tokenize(text)
+    stopwords_list = _get_stopwords(tuple(languages))
 
-    # Check if the text is a single stopword
-    if len(tokens) == 1 and tokens[0].lower() in stopwords_list:
-        return True
+    # Tokenize the text, punctuation marks are kept as (non-stopword) tokens
+    tokens = WORD_REGEX.findall(text.lower())
 
-    # Check if all tokens are stopwords
-    return all(token.lower() in stopwords_list for token in tokens)
+    # Check if the text is a single stopword or all tokens are stopwords
+    return all(token in stopwords_list for token in tokens)
 
 
 def tokenise(text: str, language: str) -> list[str]:
@@ -146,37 +297,29 @@ def tokenise(text: str, language: str) -> list[str]:
     if not text:
         return []
 
-    if language not in WHITESPACE_RULES:
-        # Default behavior for languages without specific rules:
-        # tokenize using standard whitespace splitting
-        language = "other"
-
-    wsrules = WHITESPACE_RULES[language]
-    tokenized_text = []
-    current_token = ""
-
-    for char in text:
-        if char in wsrules["pct_no_ws_before_after"]:
-            if current_token:
-                tokenized_text.append(current_token)
-            tokenized_text.append(char)
-            current_token = ""
-        elif char in wsrules["pct_no_ws_before"] or char in wsrules["pct_no_ws_after"]:
-            if current_token:
-                tokenized_text.append(current_token)
-            tokenized_text.append(char)
-            current_token = ""
-        elif char.isspace():
-            if current_token:
-                tokenized_text.append(current_token)
-                current_token = ""
-        else:
-            current_token += char
+    # languages without specific rules fall back on the "other" rules
+    return TOKEN_REGEXES.get(language, _DEFAULT_TOKEN_REGEX).findall(text)
 
-    if current_token:
-        tokenized_text.append(current_token)
 
-    return tokenized_text
+def tokenise_batch(texts: list[str], language: str) -> list[list[str]]:
+    """Separate each of the given texts, all in the same language, into tokens.
+
+    Equivalent to calling `tokenise` on each text, but the language's regex is
+    only looked up once for the whole batch.
+
+    Args:
+        texts (list[str]): The input texts to separate into lists of tokens.
+        language (str): Language of the texts.
+
+    Returns:
+        list[list[str]]: List of tokens of each text, in the same order.
+    """
+    findall = TOKEN_REGEXES.get(language, _DEFAULT_TOKEN_REGEX).findall
+    return [findall(text) if text else [] for text in texts]
+
+
+# translation table deleting spaces and tabs
+_NORMALIZE_TABLE = str.maketrans("", "", " \t")
 
 
 def normalize_text(text: str) -> str:
@@ -188,7 +331,7 @@ def normalize_text(text: str) -> str:
     Returns:
         str: Normalized text.
     """
-    return re.sub(r"[ \t]+", "", text)
+    return text.translate(_NORMALIZE_TABLE)
 
 
 def search_text(article_text: str, search_text: str) -> list[tuple[int, int]]:
@@ -204,6 +347,12 @@ def search_text(article_text: str, search_text: str) -> list[tuple[int, int]]:
     # Normalize texts by removing spaces and tabs
     normalized_article = normalize_text(article_text)
     normalized_search = normalize_text(search_text)
+    search_len = len(normalized_search)
+
+    # Map the normalized text back to the original one: position in the original
+    # article of each normalized character, and of each non-whitespace character
+    normalized_to_original = [i for i, c in enumerate(article_text) if c not in " \t"]
+    non_ws_positions = [i for i, c in enumerate(article_text) if c not in " \t\n"]
 
     # Initialize a list to hold all start and end indices
     indices = []
@@ -216,21 +365,16 @@ def search_text(article_text: str, search_text: str) -> list[tuple[int, int]]:
             break
 
         # Calculate the actual start and end indices in the original article text
-        original_chars = 0
-        original_start_index = 0
-        for i in range(start_index):
-            while article_text[original_start_index] in (" ", "\t"):
-                original_start_index += 1
-            if article_text[original_start_index] not in (" ", "\t", "\n"):
-                original_chars += 1
-            original_start_index += 1
+        if start_index > 0:
+            original_start_index = normalized_to_original[start_index - 1] + 1
+        else:
+            original_start_index = 0
 
+        # the end is right after the search_len-th non-whitespace character
         original_end_index = original_start_index
-        search_chars = 0
-        while search_chars < len(normalized_search):
-            if article_text[original_end_index] not in (" ", "\t", "\n"):
-                search_chars += 1
-            original_end_index += 1  # Increment to include the last character
+        if search_len > 0:
+            first_char = bisect_left(non_ws_positions, original_start_index)
+            original_end_index = non_ws_positions[first_char + search_len - 1] + 1
 
         if article_text[original_start_index] == " ":
             original_start_index += 1
@@ -1,22 +1,25 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-from collections import namedtuple
 import sys
-import json
 import os
 import logging
 import pathlib
 import time
-from typing import Any, Generator, Optional
+import zlib
+from typing import Any, Generator, Iterable, NamedTuple, Optional, TYPE_CHECKING
 from datetime import timedelta, date
 from contextlib import ExitStack
+from functools import lru_cache
+from itertools import islice
 import jsonschema
 import importlib_resources
-import numpy as np
+import orjson
 
-from dask.bag.core import Bag
-from dask.diagnostics import ProgressBar
+# dask is only needed by `partitioner`, it's imported lazily
+# to keep importing this module (and its constants) lightweight.
+if TYPE_CHECKING:
+    from dask.bag.core import Bag
 
 logger = logging.getLogger(__name__)
 
@@ -173,11 +176,21 @@ KNOWN_JOURNALS_DICT = {
 }
 # flatten the known journals into a sorted list
 KNOWN_JOURNALS = sorted([j for part_j in KNOWN_JOURNALS_DICT.values() for j in part_j])
+# for membership tests of a given journal
+KNOWN_JOURNALS_SET = frozenset(KNOWN_JOURNALS)
 PARTNERS_WITHOUT_OLR = ["NZZ", "SWA", "BCUL"]
 
-# a simple data structure to represent input directories
-# a `Document.zip` file is expected to be found in `IssueDir.path`
-IssueDir = namedtuple("IssueDir", ["journal", "date", "edition", "path"])
+
+class IssueDir(NamedTuple):
+    """A simple data structure to represent input directories.
+
+    A `Document.zip` file is expected to be found in `IssueDir.path`.
+    """
+
+    journal: str
+    date: date
+    edition: str
+    path: str
 
 
 def user_confirmation(question: str, default: str | None = None) -> bool:
@@ -251,11 +264,11 @@ def timestamp(ts_format: str = "%Y-%m-%dT%H:%M:%SZ", with_space: bool = False) -
 
 
 class Timer:
-    """Basic timer"""
+    """Basic timer, based on a monotonic clock."""
 
     def __init__(self):
-        self.start = time.time()
-        self.intermediate = time.time()
+        self.start = time.monotonic_ns()
+        self.intermediate = self.start
 
     def tick(self) -> str:
         """Perform a tick with the timer.
@@ -263,9 +276,10 @@ class Timer:
         Returns:
             str: Elapsed time since last tick in seconds.
         """
-        elapsed_time = time.time() - self.intermediate
-        self.intermediate = time.time()
-        return str(timedelta(seconds=elapsed_time))
+        now = time.monotonic_ns()
+        elapsed_time = now - self.intermediate
+        self.intermediate = now
+        return str(timedelta(microseconds=elapsed_time // 1000))
 
     def stop(self) -> str:
         """Stop the timer.
@@ -273,22 +287,26 @@ class Timer:
         Returns:
             str: Elapsed time since the start tick in seconds.
         """
-        elapsed_time = time.time() - self.start
-        return str(timedelta(seconds=elapsed_time))
+        elapsed_time = time.monotonic_ns() - self.start
+        return str(timedelta(microseconds=elapsed_time // 1000))
+
 
+def chunk(l_to_chunk: Iterable, chunksize: int) -> Generator[list, None, None]:
+    """Yield successive n-sized chunks from a list or any other iterable.
 
-def chunk(l_to_chunk: list, chunksize: int) -> Generator:
-    """Yield successive n-sized chunks from list.
+    The input is consumed lazily, so generators can be chunked without being
+    materialized first.
 
     Args:
-        l_to_chunk (list): List to chunk down.
+        l_to_chunk (Iterable): List (or iterable) to chunk down.
         chunksize (int): Size of each chunk.
 
     Yields:
-        Generator: Each chunk of the list.
+        Generator[list, None, None]: Each chunk of the list, as a list.
     """
-    for i in range(0, len(l_to_chunk), chunksize):
-        yield l_to_chunk[i : i + chunksize]
+    iterator = iter(l_to_chunk)
+    while batch := list(islice(iterator, chunksize)):
+        yield batch
 
 
 def get_pkg_resource(
@@ -314,7 +332,10 @@ def get_pkg_resource(
 
 
 def init_logger(
-    _logger: logging.RootLogger, level: int = logging.INFO, file: Optional[str] = None
+    _logger: logging.RootLogger,
+    level: int = logging.INFO,
+    file: Optional[str] = None,
+    stdout: bool = False,
 ) -> logging.RootLogger:
     """Initialises the root logger.
 
@@ -322,6 +343,8 @@ def init_logger(
         _logger (logging.RootLogger): Logger instance to initialise.
         level (int, optional): desired level of logging. Defaults to logging.INFO.
         file (str | None, optional): _description_. Defaults to None.
+        stdout (bool, optional): Whether to also log to stdout when logging to a
+            file. Defaults to False.
 
     Returns:
         logging.RootLogger: the initialised logger
@@ -330,18 +353,45 @@ def init_logger(
     _logger.setLevel(level)
 
     if file is not None:
-        handler = logging.FileHandler(filename=file, mode="w")
+        handlers = [logging.FileHandler(filename=file, mode="w")]
+        if stdout:
+            handlers.append(logging.StreamHandler(sys.stdout))
     else:
-        handler = logging.StreamHandler()
+        handlers = [logging.StreamHandler()]
 
     formatter = logging.Formatter("%(asctime)s %(name)-12s %(levelname)-8s %(message)s")
-    handler.setFormatter(formatter)
-    _logger.addHandler(handler)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        _logger.addHandler(handler)
     _logger.info("Logger successfully initialised")
 
     return _logger
 
 
+@lru_cache(maxsize=8)
+def _get_schema_validator(path_to_schema: str) -> jsonschema.protocols.Validator:
+    """Load a JSON schema of the package and create its validator, only once per schema.
+
+    Args:
+        path_to_schema (str): Path to the JSON schema within the package.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: The schema itself is invalid.
+
+    Returns:
+        jsonschema.protocols.Validator: Validator for the given schema.
+    """
+    with ExitStack() as file_manager:
+        schema_path = get_pkg_resource(file_manager, path_to_schema)
+        with open(schema_path, "rb") as f:
+            json_schema = orjson.loads(f.read())
+
+    validator_cls = jsonschema.validators.validator_for(json_schema)
+    validator_cls.check_schema(json_schema)
+
+    return validator_cls(json_schema)
+
+
 def validate_against_schema(
     json_to_validate: dict[str, Any],
     path_to_schema: str = "schemas/json/versioning/manifest.schema.json",
@@ -356,13 +406,15 @@ def validate_against_schema(
     Raises:
         e: The provided JSON could not be validated against the provided schema.
     """
-    file_manager = ExitStack()
-    schema_path = get_pkg_resource(file_manager, path_to_schema)
-    with open(os.path.join(schema_path), "r", encoding="utf-8") as f:
-        json_schema = json.load(f)
+    validator = _get_schema_validator(path_to_schema)
 
     try:
-        jsonschema.validate(json_to_validate, json_schema)
+        # same behavior as `jsonschema.validate`, but without re-checking the schema
+        error = jsonschema.exceptions.best_match(
+            validator.iter_errors(json_to_validate)
+        )
+        if error is not None:
+            raise error
     except Exception as e:
         logger.error(
             "The provided JSON could not be validated against its schema: %s.",
@@ -371,6 +423,11 @@ def validate_against_schema(
         raise e
 
 
+# exponent of the base size for each unit, and the resulting divisors for base 1024
+BYTES_UNITS = {"k": 1, "m": 2, "g": 3, "t": 4, "p": 5, "e": 6}
+BYTES_DIVISORS_1024 = {unit: 1024**exp for unit, exp in BYTES_UNITS.items()}
+
+
 def bytes_to(bytes_nb: int, to_unit: str, bsize: int = 1024) -> float:
     """Convert bytes to the specified unit.
 
@@ -390,8 +447,9 @@ def bytes_to(bytes_nb: int, to_unit: str, bsize: int = 1024) -> float:
     Raises:
         KeyError: If the specified target unit is not supported.
     """
-    units = {"k": 1, "m": 2, "g": 3, "t": 4, "p": 5, "e": 6}
-    return float(bytes_nb) / (bsize ** units[to_unit])
+    if bsize == 1024:
+        return float(bytes_nb) / BYTES_DIVISORS_1024[to_unit]
+    return float(bytes_nb) / (bsize ** BYTES_UNITS[to_unit])
 
 
 def get_list_intersection(list1: list, list2: list) -> list:
@@ -407,7 +465,7 @@ def get_list_intersection(list1: list, list2: list) -> list:
     return list(set(list1).intersection(list2))
 
 
-def partitioner(bag: Bag, path: str, nb_partitions: int) -> None:
+def partitioner(bag: "Bag", path: str, nb_partitions: int) -> None:
     """
     Partition a Dask bag into n partitions and write each to a separate file.
 
@@ -419,8 +477,13 @@ def partitioner(bag: Bag, path: str, nb_partitions: int) -> None:
     Returns:
         None: The function writes partitioned files to the specified path.
     """
+    from dask.diagnostics import ProgressBar
+
+    # deterministic (unlike `hash` on str, which is salted per process) pseudo-random
+    # assignment of each item to one of the partitions
     grouped_items = bag.groupby(
-        lambda x: np.random.randint(500), npartitions=nb_partitions
+        lambda x: zlib.crc32(repr(x).encode("utf-8")) % nb_partitions,
+        npartitions=nb_partitions,
     )
     items = grouped_items.map(lambda x: x[1]).flatten()
     path = os.path.join(path, "*.jsonl.bz2")
@@ -438,8 +501,7 @@ def id_to_issuedir(canonical_id: str, issue_path: str) -> IssueDir:
     Returns:
         IssueDir: IssueDir instance for the object
     """
-    newspaper, year, month, day, edition = canonical_id.split("-")
-    year = int(year)
-    month = int(month)
-    day = int(day)
-    return IssueDir(newspaper, date(year, month, day), edition, issue_path)
+    # canonical IDs are of the form `[alias]-[YYYY]-[MM]-[DD]-[edition]`
+    newspaper, date_edition = canonical_id.split("-", 1)
+    iso_date, edition = date_edition.rsplit("-", 1)
+    return IssueDir(newspaper, date.fromisoformat(iso_date), edition, issue_path)
@@ -12,6 +12,23 @@ from dask.distributed import progress, Client
 logger = logging.getLogger(__name__)
 
 
+def ci_id_fields(ci_id: str) -> dict[str, str]:
+    """Extract the title, year and issue from a content-item ID in a single pass.
+
+    >>> ci_id_fields("GDL-1950-01-02-a-i0002")
+    >>> {'np_id': 'GDL', 'year': '1950', 'issues': 'GDL-1950-01-02-a'}
+
+    Args:
+        ci_id (str): Canonical ID of a content-item.
+
+    Returns:
+        dict[str, str]: Title, year and issue ID the content-item belongs to.
+    """
+    issue_id = ci_id.rsplit("-", 1)[0]
+    np_id, year, _ = issue_id.split("-", 2)
+    return {"np_id": np_id, "year": year, "issues": issue_id}
+
+
 def counts_for_canonical_issue(
     issue: dict[str, Any], include_np_yr: bool = False
 ) -> dict[str, int]:
@@ -25,14 +42,11 @@ def counts_for_canonical_issue(
     Returns:
         dict[str, int]: Dict listing the counts for this issue, ready to be aggregated.
     """
-    counts = (
-        {
-            "np_id": issue["id"].split("-")[0],
-            "year": issue["id"].split("-")[1],
-        }
-        if include_np_yr
-        else {}
-    )
+    if include_np_yr:
+        np_id, year, _ = issue["id"].split("-", 2)
+        counts = {"np_id": np_id, "year": year}
+    else:
+        counts = {}
     counts.update(
         {
             "issues": 1,
@@ -58,12 +72,12 @@ def counts_for_rebuilt(
     Returns:
         dict[str, Union[int, str]]: Dict with rebuilt (passim) keys and counts for 1 CI.
     """
-    split_id = rebuilt_ci["id"].split("-")
-    counts = {"np_id": split_id[0]} if include_np else {}
+    id_fields = ci_id_fields(rebuilt_ci["id"])
+    counts = {"np_id": id_fields["np_id"]} if include_np else {}
     counts.update(
         {
-            "year": split_id[1],
-            "issues": "-".join(split_id[:-1]),  # count the issues represented
+            "year": id_fields["year"],
+            "issues": id_fields["issues"],  # count the issues represented
             "content_items_out": 1,
         }
     )
@@ -263,17 +277,7 @@ def compute_stats_in_entities_bag(
     count_df = (
         s3_entities.map(
             lambda ci: {
-                "np_id": (
-                    ci["id"].split("-")[0] if "id" in ci else ci["ci_id"].split("-")[0]
-                ),
-                "year": (
-                    ci["id"].split("-")[1] if "id" in ci else ci["ci_id"].split("-")[1]
-                ),
-                "issues": (
-                    "-".join(ci["id"].split("-")[:-1])
-                    if "id" in ci
-                    else "-".join(ci["ci_id"].split("-")[:-1])
-                ),
+                **ci_id_fields(ci["id"] if "id" in ci else ci["ci_id"]),
                 "content_items_out": 1,
                 "ne_mentions": len(ci["nes"]),
                 "ne_entities": sorted(
@@ -352,9 +356,7 @@ def compute_stats_in_langident_bag(
     count_df = (
         s3_langident.map(
             lambda ci: {
-                "np_id": ci["id"].split("-")[0],
-                "year": ci["id"].split("-")[1],
-                "issues": "-".join(ci["id"].split("-")[:-1]),
+                **ci_id_fields(ci["id"]),
                 "content_items_out": 1,
                 "images": 1 if ci["tp"] == "img" else 0,
                 "lang_fd": "None" if ci["lg"] is None else ci["lg"],
@@ -467,9 +469,7 @@ def compute_stats_in_text_reuse_passage_bag(
     count_df = (
         s3_tr_passages.map(
             lambda passage: {
-                "np_id": passage["ci_id"].split("-")[0],
-                "year": passage["ci_id"].split("-")[1],
-                "issues": "-".join(passage["ci_id"].split("-")[:-1]),
+                **ci_id_fields(passage["ci_id"]),
                 "content_items_out": passage["ci_id"],
                 "text_reuse_passages": 1,
                 "text_reuse_clusters": passage["cluster_id"],
@@ -553,9 +553,7 @@ def compute_stats_in_topics_bag(
 
     count_df = s3_topics.map(
         lambda ci: {
-            "np_id": ci["ci_id"].split("-")[0],
-            "year": ci["ci_id"].split("-")[1],
-            "issues": ci["ci_id"].split("-i")[0],
+            **ci_id_fields(ci["ci_id"]),
             "content_items_out": 1,
             "topics": sorted(
                 [t["t"] for t in ci["topics"] if "t" in t]
@@ -645,9 +643,7 @@ def compute_stats_in_img_emb_bag(
     count_df = (
         s3_emb_images.map(
             lambda ci: {
-                "np_id": ci["ci_id"].split("-")[0],
-                "year": ci["ci_id"].split("-")[1],
-                "issues": "-".join(ci["ci_id"].split("-")[:-1]),
+                **ci_id_fields(ci["ci_id"]),
                 "content_items_out": 1,
                 "images": 1,
             }
@@ -711,9 +707,7 @@ def compute_stats_in_lingproc_bag(
     count_df = (
         s3_lingprocs.map(
             lambda ci: {
-                "np_id": ci["ci_id"].split("-")[0],
-                "year": ci["ci_id"].split("-")[1],
-                "issues": "-".join(ci["ci_id"].split("-")[:-1]),
+                **ci_id_fields(ci["ci_id"]),
                 "content_items_out": 1,
             }
         )
@@ -1,7 +1,7 @@
 """Command-line script to generate a manifest for an S3 bucket or partition after a processing.
 
 Usage:
-    compute_manifest.py --config-file=<cf> --log-file=<lf> [--scheduler=<sch> --nworkers=<nw> --verbose]
+    compute_manifest.py --config-file=<cf> --log-file=<lf> [--scheduler=<sch> --nworkers=<nw> --title-workers=<tw> --verbose]
 
 Options:
 
@@ -9,27 +9,37 @@ Options:
 --log-file=<lf>  Path to log file to use.
 --scheduler=<sch>  Tell dask to use an existing scheduler (otherwise it'll create one)
 --nworkers=<nw>  number of workers for (local) Dask client.
+--title-workers=<tw>  number of titles for which statistics are computed at the same time (default 1).
 --verbose  Set logging level to DEBUG (by default is INFO).
 """
 
 import json
-import os
-import traceback
 import logging
-from typing import Any, Optional
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Any, Iterable, Optional
 import git
+import orjson
 from docopt import docopt
 
+import dask
 import dask.bag as db
 from dask.distributed import Client
-from impresso_essentials.io.s3 import fixed_s3fs_glob, IMPRESSO_STORAGEOPT
-from impresso_essentials.utils import init_logger, KNOWN_JOURNALS
+from impresso_essentials.io.s3 import fixed_s3fs_glob, join_s3_path, IMPRESSO_STORAGEOPT
+from impresso_essentials.utils import init_logger, KNOWN_JOURNALS, KNOWN_JOURNALS_SET
 from impresso_essentials.versioning.helpers import validate_stage, DataStage
 from impresso_essentials.versioning import aggregators
 from impresso_essentials.versioning.data_manifest import DataManifest
 
 logger = logging.getLogger(__name__)
 
+# maximum number of concurrent S3 listings when fetching the files to consider
+LISTING_MAX_WORKERS = 16
+# size of the blocks fetched from S3 when reading files (s3fs' default is 5MB)
+S3_BLOCK_SIZE = 64 * 1024 * 1024
+
 # list of optional configurations
 OPT_CONFIG_KEYS = [
     "input_bucket",
@@ -55,6 +65,37 @@ REQ_CONFIG_KEYS = [
 ]
 
 
+def parse_jsonlines(lines: Iterable[str]) -> list[dict[str, Any]]:
+    """Parse all the JSON lines of a bag partition at once.
+
+    Args:
+        lines (Iterable[str]): Lines of a partition of a bag read with `read_text`.
+
+    Returns:
+        list[dict[str, Any]]: Parsed records of the partition.
+    """
+    loads = orjson.loads
+    return [loads(line) for line in lines]
+
+
+def read_jsonlines_bag(s3_fpaths: list[str]) -> db.core.Bag:
+    """Read the given jsonlines files from S3 into a bag of parsed records.
+
+    The files are fetched in large blocks, as they are read entirely anyway: this
+    avoids issuing many small range requests per file.
+
+    Args:
+        s3_fpaths (list[str]): S3 paths of the (compressed) jsonlines files to read.
+
+    Returns:
+        db.core.Bag: Bag of the records of all the files.
+    """
+    storage_options = {**IMPRESSO_STORAGEOPT, "default_block_size": S3_BLOCK_SIZE}
+    return db.read_text(s3_fpaths, storage_options=storage_options).map_partitions(
+        parse_jsonlines
+    )
+
+
 def extract_np_key(s3_key: str, bucket: str) -> str:
     """Extract the newspaper an s3:key corresponds to given the bucket and partition
 
@@ -71,18 +112,29 @@ def extract_np_key(s3_key: str, bucket: str) -> str:
         str: Name of the corresponding newspaper, extracted form the s3 path.
     """
     # in format: 's3://31-passim-rebuilt-staging/passim/indeplux/indeplux-1889.jsonl.bz2'
-    if not bucket.endswith('/'):
-        bucket = f"{bucket}/"
-        
-    if "s3://" in bucket:
-        key_no_bucket = s3_key.replace(f"{bucket}", "")
-    else:
-        key_no_bucket = s3_key.replace(f"s3://{bucket}", "")
+    key_no_bucket = s3_key.removeprefix(_bucket_path_prefix(bucket))
     # Not all buckets separate the data per title, but the title will always come first.
-    if "/" in key_no_bucket:
-        return key_no_bucket.split("/")[0]
+    title, sep, _ = key_no_bucket.partition("/")
+    if sep:
+        return title
+
+    return key_no_bucket.partition("-")[0]
 
-    return key_no_bucket.split("-")[0]
+
+@lru_cache(maxsize=16)
+def _bucket_path_prefix(bucket: str) -> str:
+    """Get the prefix of the full S3 paths of the files within a bucket (and partition).
+
+    Args:
+        bucket (str): S3 bucket, optionally including a partition and "s3://".
+
+    Returns:
+        str: Normalized prefix, in the format "s3://[bucket]/[partition]/".
+    """
+    if not bucket.endswith("/"):
+        bucket = f"{bucket}/"
+
+    return bucket if bucket.startswith("s3://") else f"s3://{bucket}"
 
 
 def get_files_to_consider(config: dict[str, Any]) -> Optional[dict[str, list[str]]]:
@@ -110,7 +162,7 @@ def get_files_to_consider(config: dict[str, Any]) -> Optional[dict[str, list[str
         logger.info("Fetching the files to consider for all titles...")
         # TODO update list_newspapers to include possibility of partition, and unify both cases
         # return all filenames in the given bucket partition with the correct extension
-        files = fixed_s3fs_glob(os.path.join(config["output_bucket"], extension_filter))
+        files = fixed_s3fs_glob(join_s3_path(config["output_bucket"], extension_filter))
         s3_files = {}
         for s3_key in files:
             np = extract_np_key(s3_key, config["output_bucket"])
@@ -122,15 +174,40 @@ def get_files_to_consider(config: dict[str, Any]) -> Optional[dict[str, list[str
 
     # here list newspapers instead and s3_files becomes a dict np -> liest of files
     logger.info("Fetching the files to consider for titles %s...", config["newspapers"])
-    s3_files = {}
-    for np in config["newspapers"]:
-        s3_files[np] = fixed_s3fs_glob(
-            os.path.join(config["output_bucket"], np, extension_filter)
+    # listing each title is I/O bound: perform them concurrently, each title
+    # being listed sequentially to stay within the S3 client's connection pool
+    glob_paths = [
+        join_s3_path(config["output_bucket"], np, extension_filter)
+        for np in config["newspapers"]
+    ]
+    list_title_files = partial(fixed_s3fs_glob, concurrent=False)
+    with ThreadPoolExecutor(max_workers=LISTING_MAX_WORKERS) as executor:
+        s3_files = dict(
+            zip(config["newspapers"], executor.map(list_title_files, glob_paths))
         )
 
     return s3_files
 
 
+# function computing the statistics of a bag for each data stage
+STATS_FUNCTIONS = {
+    DataStage.CANONICAL: aggregators.compute_stats_in_canonical_bag,
+    DataStage.REBUILT: partial(
+        aggregators.compute_stats_in_rebuilt_bag, include_np=True
+    ),
+    DataStage.ENTITIES: aggregators.compute_stats_in_entities_bag,
+    DataStage.NEWS_AGENCIES: aggregators.compute_stats_in_entities_bag,
+    DataStage.PASSIM: partial(
+        aggregators.compute_stats_in_rebuilt_bag, include_np=True, passim=True
+    ),
+    DataStage.LANGIDENT: aggregators.compute_stats_in_langident_bag,
+    DataStage.TEXT_REUSE: aggregators.compute_stats_in_text_reuse_passage_bag,
+    DataStage.TOPICS: aggregators.compute_stats_in_topics_bag,
+    DataStage.EMB_IMAGES: aggregators.compute_stats_in_img_emb_bag,
+    DataStage.LINGPROC: aggregators.compute_stats_in_lingproc_bag,
+}
+
+
 def compute_stats_for_stage(
     files_bag: db.core.Bag, stage: DataStage, client: Optional[Client] = None
 ) -> Optional[list[dict]]:
@@ -145,34 +222,13 @@ def compute_stats_for_stage(
         list[dict] | None]: List of computed yearly statistics, or None if statistics
             computation for the given stage is not implemented.
     """
-    match stage:
-        case DataStage.CANONICAL:
-            return aggregators.compute_stats_in_canonical_bag(files_bag, client=client)
-        case DataStage.REBUILT:
-            return aggregators.compute_stats_in_rebuilt_bag(
-                files_bag, include_np=True, client=client
-            )
-        case DataStage.ENTITIES:
-            return aggregators.compute_stats_in_entities_bag(files_bag, client=client)
-        case DataStage.NEWS_AGENCIES:
-            return aggregators.compute_stats_in_entities_bag(files_bag, client=client)
-        case DataStage.PASSIM:
-            return aggregators.compute_stats_in_rebuilt_bag(
-                files_bag, include_np=True, passim=True, client=client
-            )
-        case DataStage.LANGIDENT:
-            return aggregators.compute_stats_in_langident_bag(files_bag, client=client)
-        case DataStage.TEXT_REUSE:
-            return aggregators.compute_stats_in_text_reuse_passage_bag(files_bag, client=client)
-        case DataStage.TOPICS:
-            return aggregators.compute_stats_in_topics_bag(files_bag, client=client)
-        case DataStage.EMB_IMAGES:
-            return aggregators.compute_stats_in_img_emb_bag(files_bag, client=client)
-        case DataStage.LINGPROC:
-            return aggregators.compute_stats_in_lingproc_bag(files_bag, client=client)
-    raise NotImplementedError(
-        "The function computing statistics for this DataStage is not yet implemented."
-    )
+    stats_function = STATS_FUNCTIONS.get(stage)
+    if stats_function is None:
+        raise NotImplementedError(
+            "The function computing statistics for this DataStage is not yet implemented."
+        )
+
+    return stats_function(files_bag, client=client)
 
 
 def validate_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -202,22 +258,27 @@ def validate_config(config: dict[str, Any]) -> dict[str, Any]:
 
 
 def add_stats_to_mft(
-    manifest: DataManifest, np_title: str, computed_stats: list[dict]
+    manifest: DataManifest, np_title: str, computed_stats: Iterable[dict]
 ) -> DataManifest:
+    # the statistics can be given as any iterable (eg. a generator), and are
+    # consumed one at a time.
     logger.info(
-        "%s - Populating the manifest with the resulting %s yearly statistics found...",
+        "%s - Populating the manifest with the resulting yearly statistics found...",
         np_title,
-        len(computed_stats),
     )
-    logger.debug("%s - computed_stats: %s", np_title, computed_stats)
 
+    nb_stats = 0
     for stats in computed_stats:
+        nb_stats += 1
         title = stats["np_id"]
-        if title != np_title and np_title in KNOWN_JOURNALS:
+        if title != np_title and np_title in KNOWN_JOURNALS_SET:
             # unless the value for np_title is the name of a file, ensure the correct stats are being added.
-            msg = f"Warning, some stats were computed on the wrong title! np_title={np_title}, title={title}, year={stats['year']}. Not adding them."
-            print(msg)
-            logger.info(msg)
+            logger.warning(
+                "Some stats were computed on the wrong title! np_title=%s, title=%s, year=%s. Not adding them.",
+                np_title,
+                title,
+                stats["year"],
+            )
         else:
             year = stats["year"]
             del stats["np_id"]
@@ -225,41 +286,109 @@ def add_stats_to_mft(
             logger.debug("Adding %s to %s-%s", stats, title, year)
             manifest.add_by_title_year(title, year, stats)
 
-    logger.info("%s - Finished adding stats, going to the next title...", np_title)
+    logger.info(
+        "%s - Finished adding %s yearly stats, going to the next title...",
+        np_title,
+        nb_stats,
+    )
     return manifest
 
 
+def compute_title_stats(
+    np_title: str,
+    np_s3_files: list[str],
+    stage: DataStage,
+    client: Client | None,
+) -> list[dict]:
+    """Read the S3 files of a given title and compute its statistics for the stage.
+
+    Args:
+        np_title (str): Media title to which the files correspond.
+        np_s3_files (list[str]): S3 files of this title to compute the statistics on.
+        stage (DataStage): The data stage for which statistics are computed.
+        client (Client | None): Dask client to use.
+
+    Returns:
+        list[dict]: List of computed yearly statistics for this title.
+    """
+    logger.info("---------- %s ----------", np_title)
+    logger.info("The list of files selected for %s is: %s", np_title, np_s3_files)
+    # load the selected files in dask bags
+    processed_files = read_jsonlines_bag(np_s3_files)
+
+    logger.info(
+        "%s - Starting to compute the statistics on the fetched files...",
+        np_title,
+    )
+    title_stats = compute_stats_for_stage(processed_files, stage, client)
+    logger.info("%s - Finished computing the statistics.", np_title)
+    return title_stats
+
+
 def process_by_title(
     manifest: DataManifest,
     s3_files: dict[str, list[str]],
     stage: DataStage,
     client: Client | None,
+    max_workers: int = 1,
 ) -> DataManifest:
-    logger.info("\n-> Starting computing the manifest by title <-")
-    for np_title, np_s3_files in s3_files.items():
+    """Compute the statistics of each media title separately and add them to the manifest.
 
-        if np_title in KNOWN_JOURNALS:
-            logger.info("---------- %s ----------", np_title)
-            logger.info(
-                "The list of files selected for %s is: %s",
-                np_title,
-                np_s3_files,
-            )
-            # load the selected files in dask bags
-            processed_files = db.read_text(
-                np_s3_files, storage_options=IMPRESSO_STORAGEOPT
-            ).map(json.loads)
+    Note:
+        With `max_workers` > 1, the statistics of several titles are computed at the
+        same time, which uses the cluster's workers better on small titles, but needs
+        up to about `max_workers` times more memory on the cluster. The Dask progress
+        bars are then disabled, as they would be interleaved: the progress is only
+        logged, along with each title.
 
-            logger.info(
-                "%s - Starting to compute the statistics on the fetched files...",
-                np_title,
-            )
-            computed_stats = compute_stats_for_stage(processed_files, stage, client)
+    Args:
+        manifest (DataManifest): Manifest to which the statistics are added.
+        s3_files (dict[str, list[str]]): S3 files to consider, per media title.
+        stage (DataStage): The data stage for which statistics are computed.
+        client (Client | None): Dask client to use.
+        max_workers (int, optional): Number of titles for which the statistics are
+            computed at the same time. Defaults to 1.
 
-            manifest = add_stats_to_mft(manifest, np_title, computed_stats)
+    Returns:
+        DataManifest: The manifest with the statistics of all known titles added.
+    """
+    logger.info("\n-> Starting computing the manifest by title <-")
+    titles_to_process = []
+    for np_title in s3_files.keys():
+        if np_title in KNOWN_JOURNALS_SET:
+            titles_to_process.append(np_title)
         else:
             logger.info("Found S3 files for %s which is not an known media title, it will be ignored.", np_title)
 
+    if max_workers <= 1:
+        for np_title in titles_to_process:
+            np_stats = compute_title_stats(np_title, s3_files[np_title], stage, client)
+            manifest = add_stats_to_mft(manifest, np_title, np_stats)
+        return manifest
+
+    # the statistics of several titles are computed concurrently to use all the
+    # cluster's workers, but they are added to the manifest one at a time, in order.
+    # Only a bounded window of titles is submitted ahead, so that the statistics
+    # waiting to be added don't accumulate in memory.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(np_title: str) -> tuple[str, Future]:
+            # no client is given, to avoid interleaved progress bars: the computations
+            # still run on the client, as it's the default one
+            future = executor.submit(
+                compute_title_stats, np_title, s3_files[np_title], stage, None
+            )
+            return np_title, future
+
+        titles_iter = iter(titles_to_process)
+        pending = deque(map(submit, islice(titles_iter, 2 * max_workers)))
+        while pending:
+            np_title, future = pending.popleft()
+            manifest = add_stats_to_mft(manifest, np_title, future.result())
+            # the result is released once added, and the next title can be submitted
+            del future
+            pending.extend(map(submit, islice(titles_iter, 1)))
+
     return manifest
 
 
@@ -270,41 +399,43 @@ def process_altogether(
     client: Client | None,
 ) -> DataManifest:
     logger.info(
-        "\n-> Starting to compute the manifest altogether, filterting iteratively by title <-"
+        "\n-> Starting to compute the manifest altogether, splitting the statistics by title <-"
     )
 
     s3_fpaths = [j for part_j in s3_files.values() for j in part_j]
     logger.debug("The list of files selected is: %s", s3_fpaths)
     # load the selected files in dask bags
-    processed_files = (
-        db.read_text(s3_fpaths, storage_options=IMPRESSO_STORAGEOPT)
-        .map(json.loads)
-        .persist()
-    )  # .map(lambda x: (x['ci_id'].split('-')[0], x)).persist()
+    # no need to persist: the files are only read once, as the statistics are computed
+    processed_files = read_jsonlines_bag(s3_fpaths)
 
-    total_num = len(KNOWN_JOURNALS)
-    for idx, np_title in enumerate(KNOWN_JOURNALS):
-
-        logger.info("---------- %s - %s/%s ----------", np_title, idx + 1, total_num)
+    # the statistics are grouped by title and year: compute them all in one pass
+    logger.info("Starting to compute the statistics on all the files...")
+    computed_stats = compute_stats_for_stage(processed_files, stage, client)
 
-        # filter to only keep the tr_passages for this title
-        filtered = processed_files.filter(
-            lambda x: x["ci_id"].startswith(f"{np_title}-") # in x["ci_id"]
-        ).persist()
+    stats_by_title = defaultdict(list)
+    for stats in computed_stats:
+        stats_by_title[stats["np_id"]].append(stats)
 
+    unknown_titles = stats_by_title.keys() - KNOWN_JOURNALS_SET
+    if unknown_titles:
         logger.info(
-            "%s - Starting to compute the statistics on the filtered files...",
-            np_title,
+            "Found statistics for %s which are not known media titles, they will be ignored.",
+            sorted(unknown_titles),
         )
-        computed_stats = compute_stats_for_stage(filtered, stage, client)
 
-        manifest = add_stats_to_mft(manifest, np_title, computed_stats)
+    total_num = len(KNOWN_JOURNALS)
+    for idx, np_title in enumerate(KNOWN_JOURNALS):
+        logger.info("---------- %s - %s/%s ----------", np_title, idx + 1, total_num)
+        if np_title in stats_by_title:
+            manifest = add_stats_to_mft(manifest, np_title, stats_by_title[np_title])
 
     return manifest
 
 
 def create_manifest(
-    config_dict: dict[str, Any], client: Optional[Client] = None
+    config_dict: dict[str, Any],
+    client: Optional[Client] = None,
+    titles_max_workers: int = 1,
 ) -> None:
     """Given its configuration, generate the manifest for a given s3 bucket partition.
 
@@ -318,6 +449,9 @@ def create_manifest(
     Args:
         config_dict (dict[str, Any]): Configuration following the guidelines.
         client (Client | None, optional): Dask client to use.
+        titles_max_workers (int, optional): Number of titles for which the statistics
+            are computed at the same time when processing by title, see
+            `process_by_title`. Defaults to 1.
     """
     # if the logger was not previously inialized, do it
     if not logger.hasHandlers():
@@ -374,7 +508,9 @@ def create_manifest(
         manifest = process_altogether(manifest, s3_files, stage, client)
     else:
         # processing newspapers one at a time
-        manifest = process_by_title(manifest, s3_files, stage, client)
+        manifest = process_by_title(
+            manifest, s3_files, stage, client, titles_max_workers
+        )
 
     logger.info("Finalizing the manifest, and computing the result...")
     # Add the note to the manifest
@@ -403,8 +539,11 @@ def main():
     log_level = logging.DEBUG if arguments["--verbose"] else logging.INFO
     nworkers = int(arguments["--nworkers"]) if arguments["--nworkers"] else 8
     scheduler = arguments["--scheduler"]
+    title_workers = (
+        int(arguments["--title-workers"]) if arguments["--title-workers"] else 1
+    )
 
-    init_logger(logger, log_level, log_file)
+    init_logger(logger, log_level, log_file, stdout=True)
 
     # suppressing botocore's verbose logging
     logging.getLogger("botocore").setLevel(logging.WARNING)
@@ -412,13 +551,15 @@ def main():
 
     # start the dask local cluster
     if scheduler is None:
+        # keep fewer log records in memory on long-running workers. Other overrides
+        # were dropped as they equal distributed's defaults: MALLOC_TRIM_THRESHOLD_
+        # 65536 (pre-spawn environment) and distributed.admin.low-level-log-length 1000
+        dask.config.set({"distributed.admin.log-length": 1000})
         client = Client(n_workers=nworkers, threads_per_worker=1)
     else:
         client = Client(scheduler)
 
-    dask_cluster_msg = f"Dask local cluster: {client}"
-    logger.info(dask_cluster_msg)
-    print(dask_cluster_msg)
+    logger.info("Dask local cluster: %s", client)
 
     logger.info("Reading the arguments inside %s", config_file_path)
     with open(config_file_path, "r", encoding="utf-8") as f_in:
@@ -427,11 +568,10 @@ def main():
     try:
         logger.info("Provided configuration: ")
         logger.info(config_dict)
-        create_manifest(config_dict, client)
+        create_manifest(config_dict, client, title_workers)
 
     except Exception as e:
-        traceback.print_tb(e.__traceback__)
-        print(e)
+        logger.exception("Failed to compute the manifest: %s", e)
         client.shutdown()
 
 
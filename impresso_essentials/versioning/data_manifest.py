@@ -13,7 +13,7 @@ from typing import Any, Union, Optional
 
 from git import Repo
 
-from impresso_essentials.io.s3 import get_storage_options, upload_to_s3
+from impresso_essentials.io.s3 import join_s3_path, split_s3_path, upload_to_s3
 from impresso_essentials.utils import validate_against_schema
 from impresso_essentials.versioning.data_statistics import (
     NewspaperStatistics,
@@ -39,8 +39,6 @@ logger = logging.getLogger(__name__)
 GIT_REPO_SSH_URL = "git@github.com:impresso/impresso-data-release.git"
 REPO_BRANCH_URL = "https://github.com/impresso/impresso-data-release/tree/{branch}"
 
-IMPRESSO_STORAGEOPT = get_storage_options()
-
 
 class DataManifest:
 
@@ -183,11 +181,11 @@ class DataManifest:
             return ""
 
         if self.output_s3_partition is not None:
-            s3_path = os.path.join(self.output_s3_partition, self._manifest_filename)
+            s3_path = join_s3_path(self.output_s3_partition, self._manifest_filename)
         else:
             s3_path = self._manifest_filename
 
-        full_s3_path = os.path.join("s3://", self.output_bucket_name, s3_path)
+        full_s3_path = f"s3://{join_s3_path(self.output_bucket_name, s3_path)}"
 
         # sanity check
         if (
@@ -351,9 +349,9 @@ class DataManifest:
 
             # only the rebuilt uses the canonical as input
             # text-reuse's input stage, passim rebuilt has various partitions
-            split_path = self.input_bucket_name.replace("s3://", "").split('/')
+            input_bucket, input_partition = split_s3_path(self.input_bucket_name)
             (self.input_manifest_s3_path, input_v_mft) = read_manifest_from_s3(
-                split_path[0], self._input_stage, '/'.join(split_path[1:])
+                input_bucket, self._input_stage, input_partition
             )
 
             if input_v_mft is not None:
@@ -470,7 +468,7 @@ class DataManifest:
 
         if self.output_s3_partition is not None:
             # add the path within the bucket (partition) to the manifest file
-            mft_filename = os.path.join(self.output_s3_partition, mft_filename)
+            mft_filename = join_s3_path(self.output_s3_partition, mft_filename)
 
         return upload_to_s3(out_file_path, mft_filename, self.output_bucket_name)
 
@@ -3,22 +3,24 @@
 
 import sys
 import copy
-import json
 import logging
 import os
 import re
-from time import strptime
+from time import strftime, strptime
 from typing import Any, Union, Optional
 from tqdm import tqdm
 import git
+import orjson
 
 from impresso_essentials.utils import bytes_to
 from impresso_essentials.io.s3 import (
     fixed_s3fs_glob,
     alternative_read_text,
-    get_storage_options,
+    IMPRESSO_STORAGEOPT,
     get_bucket,
-    get_s3_object_size,
+    get_s3_object_sizes,
+    join_s3_path,
+    split_s3_path,
 )
 
 if sys.version < "3.11":
@@ -32,9 +34,15 @@ else:
 logger = logging.getLogger(__name__)
 
 
-IMPRESSO_STORAGEOPT = get_storage_options()
 POSSIBLE_GRANULARITIES = ["corpus", "title", "year"]
 VERSION_INCREMENTS = ["major", "minor", "patch"]
+# modification dates are zero-padded "%Y-%m-%d %H:%M:%S" strings, which order
+# chronologically when compared as strings. The regex only matches valid dates (days
+# after the 28th are left to strptime, as their validity depends on the month).
+MODIF_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+MODIF_DATE_REGEX = re.compile(
+    r"\d{4}-(0[1-9]|1[0-2])-(0[1-9]|1\d|2[0-8]) ([01]\d|2[0-3]):[0-5]\d:[0-5]\d"
+)
 
 
 class DataStage(StrEnum):
@@ -111,8 +119,9 @@ def validate_stage(
             stage = DataStage[data_stage]
         return stage.value if return_value_str else stage
     except ValueError as e:
-        err_msg = f"{e} \nProvided data stage '{data_stage}' is not a valid data stage."
-        logger.critical(err_msg)
+        logger.critical(
+            "%s \nProvided data stage '%s' is not a valid data stage.", e, data_stage
+        )
         raise e
 
 
@@ -163,8 +172,9 @@ def validate_version(v: str, regex: str = "^v([0-9]+[.]){2}[0-9]+$") -> Optional
     if re.match(regex, v) is not None:
         return v
 
-    msg = f"Non conforming version {v} provided: ({regex}), version will be inferred."
-    logger.critical(msg)
+    logger.critical(
+        "Non conforming version %s provided: (%s), version will be inferred.", v, regex
+    )
     return None
 
 
@@ -285,8 +295,7 @@ def find_s3_data_manifest_path(
         assert partition is not None, "partition should be provided for processed data"
         # processed data are all in the same bucket,
         # manifest should be directly fetched from path
-        full_s3_path = os.path.join(bucket_name, partition, path_filter)
-        # print(full_s3_path)
+        full_s3_path = join_s3_path(bucket_name, partition, path_filter)
         matches = fixed_s3fs_glob(full_s3_path)
 
     # matches will always be a list
@@ -329,7 +338,7 @@ def read_manifest_from_s3(
         manifest_s3_path, IMPRESSO_STORAGEOPT, line_by_line=False
     )
 
-    return manifest_s3_path, json.loads(raw_text)
+    return manifest_s3_path, orjson.loads(raw_text)
 
 
 def read_manifest_from_s3_path(manifest_s3_path: str) -> Optional[dict[str, Any]]:
@@ -345,7 +354,7 @@ def read_manifest_from_s3_path(manifest_s3_path: str) -> Optional[dict[str, Any]
         raw_text = alternative_read_text(
             manifest_s3_path, IMPRESSO_STORAGEOPT, line_by_line=False
         )
-        return json.loads(raw_text)
+        return orjson.loads(raw_text)
     except FileNotFoundError as e:
         logger.error("No manifest found at s3 path %s. %s", manifest_s3_path, e)
         return None
@@ -533,14 +542,14 @@ def git_commit_push(
         git_repo.index.commit(commit_msg)
         origin = git_repo.remote(name="origin")
 
-        push_msg = f"Pushing {filename} with commit message '{commit_msg}'"
-        logger.info(push_msg)
+        logger.info("Pushing %s with commit message '%s'", filename, commit_msg)
         origin.push()
 
         return True
     except git.exc.GitError as e:
-        err_msg = f"Error while pushing {filename} to its remote repository. \n{e}"
-        logger.error(err_msg)
+        logger.error(
+            "Error while pushing %s to its remote repository. \n%s", filename, e
+        )
         return False
 
 
@@ -758,6 +767,29 @@ def manifest_summary(mnf_json: dict[str, Any], extended_summary: bool = False) -
             print("\n")
 
 
+def _modif_date_key(modif_date: str) -> str:
+    """Validate a manifest modification date and return it as a comparable key.
+
+    Zero-padded dates of the form "%Y-%m-%d %H:%M:%S" compare chronologically as
+    strings, so no parsing is necessary once their format has been checked. Other
+    dates (e.g. not zero-padded, or after the 28th) are parsed and normalized to
+    this form, so that they are accepted, rejected and ordered as when all dates
+    were parsed.
+
+    Args:
+        modif_date (str): Modification date of a media item in a manifest.
+
+    Raises:
+        ValueError: The date does not follow the "%Y-%m-%d %H:%M:%S" format.
+
+    Returns:
+        str: The validated, zero-padded, modification date.
+    """
+    if MODIF_DATE_REGEX.fullmatch(modif_date) is not None:
+        return modif_date
+    return strftime(MODIF_DATE_FORMAT, strptime(modif_date, MODIF_DATE_FORMAT))
+
+
 def filter_new_or_modified_media(
     rebuilt_mft_json: dict[str, Any], previous_mft_json: dict[str, Any]
 ) -> dict[str, Any]:
@@ -785,9 +817,7 @@ def filter_new_or_modified_media(
 
     # Extract last modification date of each media item of the previous process
     previous_media_items = {
-        media["media_title"]: strptime(
-            media["last_modification_date"], "%Y-%m-%d %H:%M:%S"
-        )
+        media["media_title"]: _modif_date_key(media["last_modification_date"])
         for media in previous_mft_json["media_list"]
     }
 
@@ -800,7 +830,7 @@ def filter_new_or_modified_media(
         if rebuilt_media_item["media_title"] not in previous_media_items:
             filtered_media_list.append(rebuilt_media_item)
         elif (
-            strptime(rebuilt_media_item["last_modification_date"], "%Y-%m-%d %H:%M:%S")
+            _modif_date_key(rebuilt_media_item["last_modification_date"])
             > previous_media_items[rebuilt_media_item["media_title"]]
         ):
             filtered_media_list.append(rebuilt_media_item)
@@ -861,30 +891,30 @@ def get_media_item_years(mnf_json: dict[str, Any]) -> dict[str, dict[str, float]
     """
 
     bucket_name = mnf_json["mft_s3_path"].rsplit("/", 1)[0]
+    # the bucket name without the s3 prefix is the same for all the keys,
+    # it can include a partition, which is then part of the keys
+    bucket_no_prefix, partition = split_s3_path(bucket_name)
+    key_prefix = f"{partition}/" if partition else ""
     media_items_years = {}
 
     logger.info("*** Retrieving size info for each key")
     for media_item in tqdm(mnf_json["media_list"]):
         title = media_item["media_title"]
-        years = {}
-
-        for media_year in media_item["media_statistics"]:
-            if media_year["granularity"] != "year":
-                continue
-
-            year_key = title + "/" + media_year["element"] + ".jsonl.bz2"
-            s3_key = bucket_name + "/" + year_key
-            year_size_b = get_s3_object_size(bucket_name.split("//")[1], year_key)
-            year_size_m = (
-                round(bytes_to(year_size_b, "m"), 2)
-                if year_size_b is not None
-                else None
-            )
-            # print(f"Size in b: {year_size_b}, in mb: {year_size_m}")
 
-            years[s3_key] = year_size_m
-
-        media_items_years[title] = years
+        year_keys = [
+            f"{key_prefix}{title}/{media_year['element']}.jsonl.bz2"
+            for media_year in media_item["media_statistics"]
+            if media_year["granularity"] == "year"
+        ]
+        # the sizes of all the years of a title are fetched together
+        sizes_b = get_s3_object_sizes(bucket_no_prefix, year_keys)
+
+        media_items_years[title] = {
+            f"s3://{bucket_no_prefix}/{year_key}": (
+                round(bytes_to(size_b, "m"), 2) if size_b is not None else None
+            )
+            for year_key, size_b in sizes_b.items()
+        }
 
     logger.info("*** About the collection if s3 keys for each year:")
     for t, y in media_items_years.items():
@@ -2,10 +2,11 @@
 # coding: utf-8
 from contextlib import ExitStack
 from datetime import date
-import json
+import io
+from itertools import islice
 from unittest import mock
 import pytest
-import dask.bag as db
+import orjson
 import botocore
 from impresso_essentials.io import s3
 from impresso_essentials.utils import IssueDir, get_pkg_resource
@@ -19,6 +20,7 @@ def test_get_storage_options():
     }
     assert "key" in storage and storage["key"] is not None
     assert "secret" in storage and storage["secret"] is not None
+    assert storage["config_kwargs"]["max_pool_connections"] > 10
 
 
 get_or_create_bucket_testdata = [
@@ -51,18 +53,16 @@ read_jsonlines_testdata = [
 @pytest.mark.parametrize("bucket,key,expected", read_jsonlines_testdata)
 def test_read_jsonlines(bucket, key, expected):
 
+    # the lines are counted while streaming them, without building a dask bag
+    field = {"issues": "i", "pages": "r", "rebuilt": "ppreb"}.get(expected)
     try:
-        lines = db.from_sequence(s3.read_jsonlines(key, bucket))
+        lines = s3.read_jsonlines(key, bucket)
+        first_lines = list(islice(lines, 10))
+        count_lines = len(first_lines) + sum(1 for _ in lines)
     except ValueError:
         assert expected is None
     else:
-        count_lines = lines.count().compute()
-        if expected == "issues":
-            some_lines = lines.map(json.loads).pluck("i").take(10)
-        if expected == "pages":
-            some_lines = lines.map(json.loads).pluck("r").take(10)
-        if expected == "rebuilt":
-            some_lines = lines.map(json.loads).pluck("ppreb").take(10)
+        some_lines = [orjson.loads(line)[field] for line in first_lines]
 
         assert count_lines is not None
         assert count_lines > 0
@@ -70,6 +70,53 @@ def test_read_jsonlines(bucket, key, expected):
         assert len(some_lines) > 0
 
 
+def test_read_jsonlines_range():
+    bucket, key = "21-rebuilt-staging", "DLE/DLE-1910.jsonl.bz2"
+
+    first_lines = list(s3.read_jsonlines_range(key, bucket, (0, 1024 * 1024)))
+    all_lines = list(s3.read_jsonlines(key, bucket))
+
+    assert len(first_lines) > 0
+    assert first_lines == all_lines[: len(first_lines)]
+
+    # bz2 archives can't be decompressed from the middle
+    with pytest.raises(ValueError):
+        list(s3.read_jsonlines_range(key, bucket, (10, 1024)))
+
+
+@pytest.mark.parametrize(
+    "part_size,max_workers", [(1000, 1), (1000, 4), (4096, 2), (777, 3), (20000, 4)]
+)
+@mock.patch("impresso_essentials.io.s3.get_s3_client")
+def test_iter_ranged_chunks(mock_get_s3_client, part_size, max_workers):
+    # an object spanning several parts, the last one being incomplete
+    data = bytes(range(256)) * 50 + b"end"
+    first_body = mock.Mock(wraps=io.BytesIO(data))
+
+    def get_object(Bucket, Key, Range, IfMatch):
+        start, end = map(int, Range.removeprefix("bytes=").split("-"))
+        return {"Body": io.BytesIO(data[start : end + 1])}
+
+    mock_get_s3_client.return_value.get_object.side_effect = get_object
+
+    chunks = s3._iter_ranged_chunks(
+        first_body,
+        "GDL/GDL-1950.jsonl.bz2",
+        "22-rebuilt-final",
+        len(data),
+        '"some-etag"',
+        part_size=part_size,
+        max_workers=max_workers,
+    )
+
+    assert b"".join(chunks) == data
+    first_body.close.assert_called_once()
+    # the parts after the first one are requested for the same object version
+    ranged_calls = mock_get_s3_client.return_value.get_object.call_args_list
+    assert len(ranged_calls) == max(0, -(-len(data) // part_size) - 1)
+    assert all(c.kwargs["IfMatch"] == '"some-etag"' for c in ranged_calls)
+
+
 readtext_jsonlines_testdata = [
     (
         "21-rebuilt-staging",
@@ -87,12 +134,13 @@ readtext_jsonlines_testdata = [
 def test_readtext_jsonlines(bucket, key, to_keep, expected):
 
     try:
-        lines = db.from_sequence(s3.readtext_jsonlines(key, bucket, to_keep))
+        lines = s3.readtext_jsonlines(key, bucket, to_keep)
+        first_lines = list(islice(lines, 10))
+        count_lines = len(first_lines) + sum(1 for _ in lines)
     except ValueError:
         assert expected is None
     else:
-        count_lines = lines.count().compute()
-        some_lines = lines.map(json.loads).take(10)
+        some_lines = [orjson.loads(line) for line in first_lines]
 
         assert count_lines is not None
         assert count_lines > 0
@@ -117,7 +165,9 @@ def test_upload_to_s3(mock_get_bucket):
     mock_bucket.upload_file.return_value = None  # Upload succeeds
 
     assert s3.upload_to_s3(local_filepath, s3_path, bucket_name) is True
-    mock_bucket.upload_file.assert_called_once_with(local_filepath, s3_path)
+    mock_bucket.upload_file.assert_called_once_with(
+        local_filepath, s3_path, Config=s3._UPLOAD_CONFIG
+    )
 
     # Test the failure case
     mock_bucket.upload_file.side_effect = Exception("Upload failed")  # Upload fails
@@ -139,6 +189,62 @@ def test_get_bucket(mock_get_s3_resource):
     mock_s3_resource.Bucket.assert_called_once_with("10-canonical-sandbox")
     assert result == mock_bucket
 
+    # the bucket is reused as long as the resource is the same
+    assert s3.get_bucket("10-canonical-sandbox") is mock_bucket
+    mock_s3_resource.Bucket.assert_called_once()
+
+
+join_s3_path_testdata = [
+    (
+        ("s3://my-bucket", "partition", "file.jsonl.bz2"),
+        "s3://my-bucket/partition/file.jsonl.bz2",
+    ),
+    (
+        ("my-bucket", "partition", "file.jsonl.bz2"),
+        "my-bucket/partition/file.jsonl.bz2",
+    ),
+    (
+        ("s3://my-bucket/", "/partition/", "file.jsonl.bz2"),
+        "s3://my-bucket/partition/file.jsonl.bz2",
+    ),
+    (("my-bucket/", "", "partition/"), "my-bucket/partition"),
+    (("my-bucket",), "my-bucket"),
+    ((), ""),
+]
+
+
+@pytest.mark.parametrize("parts,expected", join_s3_path_testdata)
+def test_join_s3_path(parts, expected):
+    assert s3.join_s3_path(*parts) == expected
+
+
+split_s3_path_testdata = [
+    (
+        "s3://my-bucket/partition/file.jsonl.bz2",
+        ("my-bucket", "partition/file.jsonl.bz2"),
+    ),
+    (
+        "my-bucket/partition/file.jsonl.bz2",
+        ("my-bucket", "partition/file.jsonl.bz2"),
+    ),
+    ("s3://my-bucket/partition/", ("my-bucket", "partition/")),
+    ("s3://my-bucket/", ("my-bucket", "")),
+    ("s3://my-bucket", ("my-bucket", "")),
+    ("my-bucket", ("my-bucket", "")),
+]
+
+
+@pytest.mark.parametrize("s3_path,expected", split_s3_path_testdata)
+def test_split_s3_path(s3_path, expected):
+    assert s3.split_s3_path(s3_path) == expected
+
+
+def test_split_join_s3_path():
+    # splitting a joined path gives back the bucket and key
+    s3_path = s3.join_s3_path("s3://my-bucket", "partition", "file.jsonl.bz2")
+    bucket_name, key = s3.split_s3_path(s3_path)
+    assert s3.join_s3_path(bucket_name, key) == s3_path.removeprefix("s3://")
+
 
 fixed_s3fs_glob_testdata = [
     (
@@ -210,9 +316,20 @@ def test_s3_glob_with_size(path, expected):
         assert all(expected(r) for r in result)
 
 
+@pytest.fixture
+def clear_credentials_client_cache():
+    # make sure no client was cached by previous calls, and that the mocked
+    # client isn't reused by the following ones
+    s3._get_credentials_client.cache_clear()
+    yield
+    s3._get_credentials_client.cache_clear()
+
+
 @mock.patch("impresso_essentials.io.s3.s_open")
 @mock.patch("boto3.Session")
-def test_alternative_read_text(mock_boto_session, mock_s_open):
+def test_alternative_read_text(
+    mock_boto_session, mock_s_open, clear_credentials_client_cache
+):
     # Mock the session client
     mock_client = mock.Mock()
     mock_boto_session.return_value.client.return_value = mock_client
@@ -233,28 +350,112 @@ def test_alternative_read_text(mock_boto_session, mock_s_open):
     mock_s_open.assert_called_once_with(
         "s3://22-rebuilt-final/GDL/GDL-1950.jsonl.bz2",
         "r",
-        transport_params={"client": mock_client},
+        transport_params={
+            "client": mock_client,
+            "buffer_size": s3.READ_BUFFER_SIZE,
+        },
+    )
+
+    # the client is reused when reading another file with the same credentials
+    s3.alternative_read_text(
+        "s3://22-rebuilt-final/GDL/GDL-1951.jsonl.bz2",
+        s3.IMPRESSO_STORAGEOPT,
+    )
+    mock_boto_session.assert_called_once()
+
+
+@mock.patch("impresso_essentials.io.s3.s_open")
+@mock.patch("impresso_essentials.io.s3._get_credentials_client")
+def test_iter_alternative_read_jsonlines(mock_get_client, mock_s_open):
+    # the file is iterated over line by line, as bytes
+    mock_file = mock.MagicMock()
+    mock_file.__iter__.return_value = iter([b'{"id": "a"}\n', b"\n", b'{"id": "b"}\n'])
+    mock_s_open.return_value.__enter__.return_value = mock_file
+
+    result = s3.iter_alternative_read_jsonlines(
+        "s3://22-rebuilt-final/GDL/GDL-1950.jsonl.bz2",
+        s3.IMPRESSO_STORAGEOPT,
+    )
+
+    # nothing is read until the lines are consumed
+    mock_s_open.assert_not_called()
+    assert list(result) == [{"id": "a"}, {"id": "b"}]
+    mock_s_open.assert_called_once_with(
+        "s3://22-rebuilt-final/GDL/GDL-1950.jsonl.bz2",
+        "rb",
+        transport_params={
+            "client": mock_get_client.return_value,
+            "buffer_size": s3.READ_BUFFER_SIZE,
+        },
     )
 
 
+@pytest.fixture
+def clear_listing_cache():
+    # make sure no listing was cached by previous calls, and that the mocked
+    # listings aren't reused by the following ones
+    s3.list_s3_directories.cache_clear()
+    yield
+    s3.list_s3_directories.cache_clear()
+
+
 @mock.patch("impresso_essentials.io.s3.get_s3_client")
-def test_list_s3_directories(mock_get_s3_client):
-    # Mock the client and list_objects_v2 response
+def test_list_s3_directories(mock_get_s3_client, clear_listing_cache):
+    # Mock the client and paginated list_objects_v2 responses
     mock_s3 = mock.Mock()
     mock_get_s3_client.return_value = mock_s3
-    mock_s3.list_objects_v2.return_value = {
-        "CommonPrefixes": [{"Prefix": "Charivari-1940/"}, {"Prefix": "Charivari-1941/"}]
-    }
+    mock_paginator = mock.Mock()
+    mock_s3.get_paginator.return_value = mock_paginator
+    mock_paginator.paginate.return_value = [
+        {"CommonPrefixes": [{"Prefix": "Charivari-1940/"}]},
+        {"CommonPrefixes": [{"Prefix": "Charivari-1941/"}]},
+    ]
 
     # Call the function
     result = s3.list_s3_directories("11-canonical-staging", "Charivari/pages")
 
-    # Check that the result is as expected
-    mock_s3.list_objects_v2.assert_called_once_with(
-        Bucket="11-canonical-staging", Prefix="Charivari/pages", Delimiter="/"
+    # Check that the result is as expected, including all pages
+    mock_s3.get_paginator.assert_called_once_with("list_objects_v2")
+    mock_paginator.paginate.assert_called_once_with(
+        Bucket="11-canonical-staging",
+        Prefix="Charivari/pages",
+        Delimiter="/",
+        PaginationConfig={"PageSize": s3.LISTING_PAGE_SIZE},
     )
     assert result == ["Charivari-1940", "Charivari-1941"]
 
+    # a second call uses the cached listing
+    assert s3.list_s3_directories("11-canonical-staging", "Charivari/pages") == result
+    mock_paginator.paginate.assert_called_once()
+
+
+@mock.patch("impresso_essentials.io.s3.monotonic")
+@mock.patch("impresso_essentials.io.s3.get_s3_client")
+def test_list_s3_directories_cache(
+    mock_get_s3_client, mock_monotonic, clear_listing_cache
+):
+    mock_paginator = mock_get_s3_client.return_value.get_paginator.return_value
+    mock_paginator.paginate.return_value = [
+        {"CommonPrefixes": [{"Prefix": "Charivari-1940/"}]},
+    ]
+    mock_monotonic.return_value = 1000.0
+
+    s3.list_s3_directories("11-canonical-staging", "Charivari/pages")
+    # within the TTL, the cached listing is used
+    mock_monotonic.return_value += s3.LIST_DIRS_TTL / 10
+    s3.list_s3_directories("11-canonical-staging", "Charivari/pages")
+    assert mock_paginator.paginate.call_count == 1
+
+    # after clearing the cache, the directories are listed again
+    s3.list_s3_directories.cache_clear()
+    s3.list_s3_directories("11-canonical-staging", "Charivari/pages")
+    assert mock_paginator.paginate.call_count == 2
+
+    # as well as once the TTL has elapsed
+    mock_monotonic.return_value += s3.LIST_DIRS_TTL
+    s3.list_s3_directories("11-canonical-staging", "Charivari/pages")
+    assert mock_paginator.paginate.call_count == 3
+
 
 @mock.patch("impresso_essentials.io.s3.get_s3_client")
 def test_get_s3_object_size(mock_get_s3_client):
@@ -292,6 +493,62 @@ def test_get_s3_object_size_client_error(mock_get_s3_client):
     assert result is None
 
 
+@mock.patch("impresso_essentials.io.s3.get_s3_client")
+def test_get_s3_object_sizes(mock_get_s3_client):
+    # Mock the S3 client and its paginator
+    mock_s3 = mock.Mock()
+    mock_get_s3_client.return_value = mock_s3
+    mock_paginator = mock.Mock()
+    mock_s3.get_paginator.return_value = mock_paginator
+    mock_paginator.paginate.return_value = [
+        {
+            "Contents": [
+                {"Key": "GDL/GDL-1950.jsonl.bz2", "Size": 1024},
+                {"Key": "GDL/GDL-1951.jsonl.bz2", "Size": 2048},
+                {"Key": "GDL/GDL-1952.jsonl.bz2", "Size": 512},
+            ]
+        }
+    ]
+
+    # Call the function
+    result = s3.get_s3_object_sizes(
+        "11-canonical-staging", ["GDL/GDL-1950.jsonl.bz2", "GDL/GDL-1953.jsonl.bz2"]
+    )
+
+    # Assertions: one listing of the common prefix instead of one head per key
+    mock_paginator.paginate.assert_called_once_with(
+        Bucket="11-canonical-staging",
+        Prefix="GDL/GDL-195",
+        PaginationConfig={"PageSize": s3.LISTING_PAGE_SIZE},
+    )
+    mock_s3.head_object.assert_not_called()
+    assert result == {"GDL/GDL-1950.jsonl.bz2": 1024, "GDL/GDL-1953.jsonl.bz2": None}
+
+
+@mock.patch("impresso_essentials.io.s3.get_s3_client")
+def test_get_s3_object_sizes_client_error(mock_get_s3_client):
+    # Mock the S3 client: listing one of the two prefixes fails
+    mock_s3 = mock.Mock()
+    mock_get_s3_client.return_value = mock_s3
+
+    def paginate(Bucket, Prefix, PaginationConfig):
+        if Prefix.startswith("JDG"):
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "AccessDenied"}}, "list_objects_v2"
+            )
+        return [{"Contents": [{"Key": "GDL/GDL-1950.jsonl.bz2", "Size": 1024}]}]
+
+    mock_s3.get_paginator.return_value.paginate.side_effect = paginate
+
+    # Call the function
+    result = s3.get_s3_object_sizes(
+        "11-canonical-staging", ["GDL/GDL-1950.jsonl.bz2", "JDG/JDG-1950.jsonl.bz2"]
+    )
+
+    # Assertions: the failed group's keys have no size, like a failed HEAD
+    assert result == {"GDL/GDL-1950.jsonl.bz2": 1024, "JDG/JDG-1950.jsonl.bz2": None}
+
+
 s3_iter_bucket_testdata = [
     ("11-canonical-staging", "DLE/issues/DLE-1910", "", None, "not None"),
     ("11-canonical-staging", "", ".json", None, "not None"),
@@ -370,6 +627,19 @@ def test_read_s3_issues(bucket, newspaper, year, expected):
         assert result[0][1]["cdt"] == expected["cdt"]
 
 
+@mock.patch("impresso_essentials.io.s3.read_jsonlines")
+def test_read_s3_issues_errors(mock_read_jsonlines):
+    # a missing issues file means there are no issues for this year
+    mock_read_jsonlines.side_effect = s3.S3KeyNotFoundError("missing")
+    assert s3.read_s3_issues("DLE", "1900", "11-canonical-staging") == []
+
+    # a corrupt issues file is not silently ignored
+    mock_read_jsonlines.side_effect = None
+    mock_read_jsonlines.return_value = iter(['{"id": "DLE-1910-01-01-a"', "}"])
+    with pytest.raises(orjson.JSONDecodeError):
+        s3.read_s3_issues("DLE", "1910", "11-canonical-staging")
+
+
 @mock.patch("impresso_essentials.io.s3.get_s3_client")
 def test_list_newspapers(mock_get_s3_client):
     # Mock the S3 client and paginator
@@ -378,14 +648,21 @@ def test_list_newspapers(mock_get_s3_client):
     mock_paginator = mock.Mock()
     mock_s3.get_paginator.return_value = mock_paginator
     mock_paginator.paginate.return_value = [
-        {"Contents": [{"Key": "ACI/issues/"}, {"Key": "BLB/issues/"}]}
+        {"KeyCount": 1, "CommonPrefixes": [{"Prefix": "BLB/"}]},
+        {"KeyCount": 1, "CommonPrefixes": [{"Prefix": "ACI/"}]},
+        {"KeyCount": 0},
     ]
 
     # Call the function
     result = s3.list_newspapers("11-canonical-staging")
 
     # Assertions
-    mock_s3.get_paginator.assert_called_once_with("list_objects")
+    mock_s3.get_paginator.assert_called_once_with("list_objects_v2")
+    mock_paginator.paginate.assert_called_once_with(
+        Bucket="11-canonical-staging",
+        Delimiter="/",
+        PaginationConfig={"PageSize": s3.LISTING_PAGE_SIZE},
+    )
     assert result == ["ACI", "BLB"]
 
 
@@ -394,17 +671,24 @@ def test_list_newspapers(mock_get_s3_client):
 def test_list_files(mock_fixed_s3fs_glob, mock_list_newspapers):
     # Mock the newspaper listing and glob output
     mock_list_newspapers.return_value = ["ACI", "BLB"]
-    mock_fixed_s3fs_glob.side_effect = [
-        ["ACI/issues/file1.jsonl.bz2", "ACI/issues/file2.jsonl.bz2"],
-        ["BLB/issues/file3.jsonl.bz2"],
-    ]
+    # the newspapers are listed concurrently, so the calls' order can vary
+    glob_outputs = {
+        "11-canonical-staging/ACI/issues/*": [
+            "ACI/issues/file1.jsonl.bz2",
+            "ACI/issues/file2.jsonl.bz2",
+        ],
+        "11-canonical-staging/BLB/issues/*": ["BLB/issues/file3.jsonl.bz2"],
+    }
+    mock_fixed_s3fs_glob.side_effect = lambda path, **kwargs: glob_outputs[path]
 
     # Call the function
     result = s3.list_files("11-canonical-staging", "issues")
 
     # Assertions
     mock_list_newspapers.assert_called_once_with("11-canonical-staging")
-    mock_fixed_s3fs_glob.assert_any_call("11-canonical-staging/ACI/issues/*")
+    mock_fixed_s3fs_glob.assert_any_call(
+        "11-canonical-staging/ACI/issues/*", concurrent=False
+    )
     assert result == (
         [
             "ACI/issues/file1.jsonl.bz2",
@@ -420,17 +704,24 @@ def test_list_files(mock_fixed_s3fs_glob, mock_list_newspapers):
 def test_list_files_pages(mock_fixed_s3fs_glob, mock_list_newspapers):
     # Mock the newspaper listing and glob output
     mock_list_newspapers.return_value = ["ACI", "BLB"]
-    mock_fixed_s3fs_glob.side_effect = [
-        ["ACI/pages/file1.jsonl.bz2", "ACI/pages/file2.jsonl.bz2"],
-        ["BLB/pages/file3.jsonl.bz2"],
-    ]
+    # the newspapers are listed concurrently, so the calls' order can vary
+    glob_outputs = {
+        "11-canonical-staging/ACI/pages/*": [
+            "ACI/pages/file1.jsonl.bz2",
+            "ACI/pages/file2.jsonl.bz2",
+        ],
+        "11-canonical-staging/BLB/pages/*": ["BLB/pages/file3.jsonl.bz2"],
+    }
+    mock_fixed_s3fs_glob.side_effect = lambda path, **kwargs: glob_outputs[path]
 
     # Call the function
     result = s3.list_files("11-canonical-staging", "pages")
 
     # Assertions
     mock_list_newspapers.assert_called_once_with("11-canonical-staging")
-    mock_fixed_s3fs_glob.assert_any_call("11-canonical-staging/ACI/pages/*")
+    mock_fixed_s3fs_glob.assert_any_call(
+        "11-canonical-staging/ACI/pages/*", concurrent=False
+    )
     assert result == (
         None,
         [
@@ -445,9 +736,13 @@ def test_list_files_pages(mock_fixed_s3fs_glob, mock_list_newspapers):
 @mock.patch("impresso_essentials.io.s3.db.read_text")
 def test_fetch_files(mock_read_text, mock_list_files):
     # Mock the list_files and Dask read_text methods
+    page_files = [
+        "ACI/pages/ACI-1832/ACI-1832-01-02-a-pages.jsonl.bz2",
+        "ACI/pages/ACI-1832/ACI-1832-01-09-a-pages.jsonl.bz2",
+    ]
     mock_list_files.return_value = (
         ["file1.jsonl.bz2", "file2.jsonl.bz2"],  # issues
-        ["page1.jsonl.bz2", "page2.jsonl.bz2"],  # pages
+        page_files,  # pages
     )
     mock_issue_bag = mock.Mock()
     mock_page_bag = mock.Mock()
@@ -459,9 +754,16 @@ def test_fetch_files(mock_read_text, mock_list_files):
     # Assertions
     mock_list_files.assert_called_once_with("11-canonical-staging", "both", None)
     mock_read_text.assert_any_call(
-        ["file1.jsonl.bz2", "file2.jsonl.bz2"], storage_options=s3.IMPRESSO_STORAGEOPT
+        ["file1.jsonl.bz2", "file2.jsonl.bz2"],
+        storage_options=s3.IMPRESSO_STORAGEOPT,
+        files_per_partition=1,
     )
     mock_read_text.assert_any_call(
-        ["page1.jsonl.bz2", "page2.jsonl.bz2"], storage_options=s3.IMPRESSO_STORAGEOPT
+        page_files, storage_options=s3.IMPRESSO_STORAGEOPT, files_per_partition=1
+    )
+    mock_issue_bag.map.assert_called_once_with(orjson.loads)
+    # the lines of both bags are parsed
+    assert result == (
+        mock_issue_bag.map.return_value,
+        mock_page_bag.map.return_value,
     )
-    assert result == (mock_issue_bag, mock_page_bag)
@@ -1,5 +1,12 @@
+from unittest import mock
 import pytest
-from impresso_essentials.text_utils import tokenise, WHITESPACE_RULES
+from impresso_essentials import text_utils
+from impresso_essentials.text_utils import (
+    segment_and_trim_batch,
+    tokenise,
+    tokenise_batch,
+    WHITESPACE_RULES,
+)
 
 
 @pytest.mark.parametrize(
@@ -29,6 +36,106 @@ def test_tokenise(text, language, expected):
     assert tokenise(text, language) == expected
 
 
+@pytest.mark.parametrize(
+    "texts,language,expected",
+    [
+        # Empty batch
+        ([], "en", []),
+        # Empty and whitespace-only texts
+        (["", "   ", "\n\t"], "en", [[], [], []]),
+        # Several texts, in the same order
+        (
+            ["Hello, world!", "(Hello) [world]!"],
+            "en",
+            [["Hello", ",", "world", "!"], ["(", "Hello", ")", "[", "world", "]", "!"]],
+        ),
+        # French rules keep "!" attached to the word
+        (["Hello world!"], "fr", [["Hello", "world!"]]),
+        # Language without rules, fallback to the "other" rules
+        (["Hello world!"], "es", [["Hello", "world", "!"]]),
+    ],
+)
+def test_tokenise_batch(texts, language, expected):
+    assert tokenise_batch(texts, language) == expected
+
+
+@pytest.fixture
+def clear_segmenters():
+    # make sure no segmenter was cached by previous calls in this thread
+    text_utils._SEGMENTERS.by_language = {}
+    yield
+    text_utils._SEGMENTERS.by_language = {}
+
+
+def test_segment_and_trim_batch_empty(clear_segmenters):
+    assert segment_and_trim_batch([], "en", 20) == []
+    assert segment_and_trim_batch([""], "en", 20) == [[]]
+
+
+def test_segment_and_trim_batch_whitespace():
+    result = segment_and_trim_batch(["   \n  \t  "], "en", 4)
+    # only whitespace is returned, in parts of at most max_length
+    assert len(result) == 1
+    assert all(not sentence.strip() for sentence in result[0])
+    assert all(len(sentence) <= 4 for sentence in result[0])
+
+
+def test_segment_and_trim_batch_unknown_language(clear_segmenters):
+    articles = ["Hello world. This is a test."]
+    # no segmenter is cached yet, and pysbd doesn't support this language
+    assert "xx" not in text_utils._SEGMENTERS.by_language
+
+    result = segment_and_trim_batch(articles, "xx", 100)
+
+    # the English segmenter is used, and cached for this language too
+    segmenters = text_utils._SEGMENTERS.by_language
+    assert segmenters["xx"] is segmenters["en"]
+    assert [s.strip() for s in result[0]] == ["Hello world.", "This is a test."]
+
+
+@mock.patch("impresso_essentials.text_utils._get_segmenter")
+def test_segment_and_trim_batch_trims(mock_get_segmenter):
+    mock_get_segmenter.return_value.segment.side_effect = [
+        ["Hello world.", "This is a somewhat longer sentence."],
+        ["Averylongwordwithoutanyspace."],
+    ]
+    articles = ["first article", "second article"]
+
+    result = segment_and_trim_batch(articles, "fr", 20)
+
+    assert result == [
+        ["Hello world.", "This is a somewhat", "longer sentence."],
+        ["Averylongwordwithout", "anyspace."],
+    ]
+    # the segmenter is only fetched once for the whole batch
+    mock_get_segmenter.assert_called_once_with("fr")
+
+
+@mock.patch("impresso_essentials.text_utils.text_to_sentences", None)
+@mock.patch("impresso_essentials.text_utils._get_segmenter")
+def test_segment_and_trim_batch_without_blingfire(mock_get_segmenter):
+    mock_get_segmenter.return_value.segment.return_value = ["Hello.", "World."]
+
+    # blingfire is not installed: pysbd is used instead
+    result = segment_and_trim_batch(["Hello. World."], "de", 20, use_blingfire=True)
+
+    assert result == [["Hello.", "World."]]
+    mock_get_segmenter.assert_called_once_with("de")
+
+
+@mock.patch("impresso_essentials.text_utils.text_to_sentences")
+@mock.patch("impresso_essentials.text_utils._get_segmenter")
+def test_segment_and_trim_batch_with_blingfire(
+    mock_get_segmenter, mock_text_to_sentences
+):
+    mock_text_to_sentences.return_value = "Hello.\nWorld."
+
+    result = segment_and_trim_batch(["Hello. World."], "de", 20, use_blingfire=True)
+
+    assert result == [["Hello.", "World."]]
+    mock_get_segmenter.assert_not_called()
+
+
 def test_whitespace_rules_keys():
     """Ensure that the necessary keys exist in WHITESPACE_RULES."""
     for language, rules in WHITESPACE_RULES.items():
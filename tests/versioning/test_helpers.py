@@ -0,0 +1,85 @@
+from time import strptime
+import pytest
+from impresso_essentials.versioning.helpers import (
+    _modif_date_key,
+    filter_new_or_modified_media,
+    MODIF_DATE_FORMAT,
+)
+
+
+def test_modif_date_key_order():
+    dates = [
+        "2024-04-03 12:00:00",
+        "2023-12-31 23:59:59",
+        "2024-04-03 09:30:00",
+        "2024-11-01 00:00:00",
+        "2024-04-03 12:00:01",
+        # not zero-padded
+        "2024-4-3 9:5:0",
+        "2024-10-3 12:00:00",
+        "2024-02-29 12:00:00",
+        "2024-01-31 23:59:60",
+    ]
+    # the keys sort the dates as their parsed values did
+    assert sorted(dates, key=_modif_date_key) == sorted(
+        dates, key=lambda d: strptime(d, MODIF_DATE_FORMAT)
+    )
+
+
+@pytest.mark.parametrize(
+    "modif_date",
+    [
+        "2024-04-03T12:00:00Z",
+        "2024-04-03",
+        "03-04-2024 12:00:00",
+        "2024-13-03 12:00:00",
+        "2023-02-29 12:00:00",
+        "2024-04-03 24:00:00",
+        " 2024-04-03 12:00:00",
+        "",
+    ],
+)
+def test_modif_date_key_malformed(modif_date):
+    # malformed dates are rejected, as they were when parsed with strptime
+    with pytest.raises(ValueError):
+        strptime(modif_date, MODIF_DATE_FORMAT)
+    with pytest.raises(ValueError):
+        _modif_date_key(modif_date)
+
+
+def _media_item(title: str, modif_date: str) -> dict[str, str]:
+    return {
+        "media_title": title,
+        "last_modification_date": modif_date,
+        "update_type": "modification",
+        "update_level": "title",
+    }
+
+
+def test_filter_new_or_modified_media():
+    previous_mft = {
+        "mft_s3_path": "s3://manifests/previous.json",
+        "media_list": [
+            _media_item("GDL", "2024-04-03 12:00:00"),
+            _media_item("JDG", "2024-04-03 12:00:00"),
+        ],
+    }
+    rebuilt_mft = {
+        "mft_s3_path": "s3://manifests/rebuilt.json",
+        "media_list": [
+            _media_item("GDL", "2024-04-03 12:00:00"),
+            _media_item("JDG", "2024-04-03 12:00:01"),
+            _media_item("IMP", "2023-01-01 00:00:00"),
+        ],
+    }
+
+    filtered = filter_new_or_modified_media(rebuilt_mft, previous_mft)
+
+    # only the modified and new titles are kept
+    assert [m["media_title"] for m in filtered["media_list"]] == ["JDG", "IMP"]
+    assert len(rebuilt_mft["media_list"]) == 3
+
+    # a malformed date in a manifest is not silently compared
+    previous_mft["media_list"][0]["last_modification_date"] = "2024-04-03T12:00:00Z"
+    with pytest.raises(ValueError):
+        filter_new_or_modified_media(rebuilt_mft, previous_mft)